@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import openpyxl
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+
+import organize_leetcode as ol
+
+DEFAULT_SIZES = [10_000, 100_000]
+STAGES = ['ingest', 'normalize', 'categorize', 'dedupe', 'sort', 'export_csv', 'export_chunked']
+REGRESSION_THRESHOLD = 1.2
+# Stages faster than this in both runs are timer noise and never flagged
+MIN_COMPARE_SECONDS = 0.05
+
+# Technique fragments seen in real problem banks, combined to get varied strings
+TECHNIQUE_WORDS = sorted({p["Technique"] for p in ol.EXTRA_PROBLEMS} | {
+    'use shrink type', 'pre-process the array', 'find next permutation', 'use reverse technique',
+    'traverse two sequences', 'difference array', 'quick select', 'boyer moore', 'cyclic sort',
+    'graph coloring', 'tree dp', 'left ptr / right ptr', 'continuous elements', 'swap in place',
+})
+
+
+def generate_workbook(path, rows, seed=0, duplicate_rate=0.05):
+    # Same layout as 'leetcode problems.xlsx': a hyperlinked "N. Name" cell per row,
+    # a Technique column, and a share of rows that reuse an earlier problem number.
+    rng = random.Random(seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Problems')
+    ws.append(['Problem Number', 'Problem Name', 'Technique', 'Completed?'])
+
+    for i in range(rows):
+        num = rng.randint(1, max(i, 1)) if i and rng.random() < duplicate_rate else i + 1
+        if rng.random() < 0.2:
+            technique = f"{rng.choice(TECHNIQUE_WORDS)} / {rng.choice(TECHNIQUE_WORDS)}"
+        else:
+            technique = rng.choice(TECHNIQUE_WORDS)
+
+        name = WriteOnlyCell(ws, value=f"{num}. Synthetic Problem {i}")
+        name.hyperlink = f"https://leetcode.com/problems/synthetic-problem-{i}/"
+        ws.append([num, name, technique, 'Yes' if rng.random() < 0.1 else None])
+
+    wb.save(path)
+
+
+def _measure(fn, rows, trace_memory):
+    # Timed without tracemalloc (it slows allocation-heavy code down), then run again
+    # under tracemalloc for the stage's own peak allocation.
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    stats = {
+        'seconds': round(seconds, 4),
+        'rows_per_sec': round(rows / seconds) if seconds else None,
+        'peak_rss_mb': ol.peak_rss_mb(),
+    }
+    if trace_memory:
+        tracemalloc.start()
+        fn()
+        stats['peak_alloc_mb'] = round(tracemalloc.get_traced_memory()[1] / (1 << 20), 1)
+        tracemalloc.stop()
+    return result, stats
+
+
+def _export_chunked(tasks, classifier, chunk_size):
+    outputs = ol.PendingOutputs()
+    ol._build_external(tasks, classifier, chunk_size, outputs)
+    outputs.commit()
+
+
+def bench_size(path, rows, chunk_size, trace_memory):
+    classifier = ol.CategoryClassifier.from_file(ol.CATEGORY_RULES)
+    tasks = ol.expand_sources([path])
+    results = {}
+
+    data, results['ingest'] = _measure(lambda: ol.read_sources(tasks, jobs=1), rows, trace_memory)
+    raw = ol._frame(data)
+
+    df, results['normalize'] = _measure(lambda: ol.normalize_problems(raw.copy()), rows, trace_memory)
+    # A fresh classifier per run so the per-technique cache does not hide the cost
+    categories, results['categorize'] = _measure(
+        lambda: ol.CategoryClassifier.from_file(ol.CATEGORY_RULES).classify(df['Technique']), rows, trace_memory)
+    df['Category'] = categories
+    (df, _), results['dedupe'] = _measure(lambda: ol.dedupe_problems(df), rows, trace_memory)
+
+    final_df, results['sort'] = _measure(
+        lambda: ol._final_frame(df.copy()).sort_values(by=['Category', 'Problem No Sort']).drop(columns=['Problem No Sort']),
+        len(df), trace_memory)
+    _, results['export_csv'] = _measure(lambda: final_df.to_csv(ol.OUTPUT_CSV, index=False), len(final_df), trace_memory)
+    _, results['export_chunked'] = _measure(
+        lambda: _export_chunked(tasks, classifier, chunk_size), rows, trace_memory)
+    return results
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    regressions = []
+    for size, stages in results['results'].items():
+        for stage, stats in stages.items():
+            before = baseline.get('results', {}).get(size, {}).get(stage)
+            if not before or not before.get('seconds'):
+                continue
+            ratio = stats['seconds'] / before['seconds']
+            slow = max(stats['seconds'], before['seconds']) >= MIN_COMPARE_SECONDS
+            flag = 'REGRESSION' if slow and ratio > threshold else ''
+            print(f"{size:>9} {stage:<15} {before['seconds']:>9.3f}s -> {stats['seconds']:>9.3f}s  x{ratio:.2f} {flag}")
+            if flag:
+                regressions.append((size, stage, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the organize_leetcode pipeline on synthetic workbooks.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma-separated row counts, e.g. 10000,100000,1000000')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=50_000, help='chunk size for the export_chunked stage')
+    parser.add_argument('--data-dir', help='keep generated workbooks here and reuse them across runs')
+    parser.add_argument('--no-trace-memory', action='store_true', help='skip the tracemalloc pass per stage')
+    parser.add_argument('--save', metavar='JSON', help='write results to this file (e.g. a new baseline)')
+    parser.add_argument('--compare', metavar='JSON', help='compare against a saved baseline; exit 1 on regressions')
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    data_dir = os.path.abspath(args.data_dir) if args.data_dir else None
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'openpyxl': openpyxl.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': args.seed,
+            'chunk_size': args.chunk_size,
+        },
+        'results': {},
+    }
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='bench_organize_') as work_dir:
+        # Outputs go to the scratch directory so the real leetcode_problems.csv is untouched
+        os.chdir(work_dir)
+        try:
+            for rows in sizes:
+                path = os.path.join(data_dir or work_dir, f"synthetic_{rows}_{args.seed}.xlsx")
+                if not os.path.exists(path):
+                    if data_dir:
+                        os.makedirs(data_dir, exist_ok=True)
+                    print(f"Generating {rows} rows -> {path}")
+                    generate_workbook(path, rows, args.seed)
+
+                stages = bench_size(path, rows, args.chunk_size, not args.no_trace_memory)
+                results['results'][str(rows)] = stages
+                for stage in STAGES:
+                    stats = stages[stage]
+                    print(f"{rows:>9} {stage:<15} {stats['seconds']:>9.3f}s {stats['rows_per_sec'] or 0:>12,} rows/s"
+                          f" {str(stats.get('peak_alloc_mb', '-')):>8} MB alloc {str(stats['peak_rss_mb']):>8} MB rss")
+        finally:
+            os.chdir(cwd)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"Saved results to '{args.save}'")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
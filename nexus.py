@@ -0,0 +1,112 @@
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+
+import organize_manifest as om
+
+# Subcommands import what they need when they run: `check`, `stats` and `env` stay on
+# the standard library (organize_manifest only needs hashlib/json/os), and only
+# `organize` pays for pandas/openpyxl.
+
+SOLVED_VALUES = {'true', 'yes'}
+
+
+def cmd_organize(args):
+    import organize_leetcode
+
+    organize_leetcode.main(args.rest)
+
+
+def cmd_check(args):
+    try:
+        reason = om.stale_reason(args.sources or (om.SOURCE_WORKBOOK,), args.emit)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if reason:
+        print(f"'{om.OUTPUT_CSV}' is out of date: {reason}")
+        return 1
+    print(f"'{om.OUTPUT_CSV}' is up to date")
+    return 0
+
+
+def cmd_stats(args):
+    # Read straight from the exported CSV with the csv module; same "solved" test as the
+    # app's CSV import (Completed? of true/yes).
+    totals, solved = Counter(), Counter()
+    try:
+        with open(args.csv, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                category = row.get('Category') or ''
+                totals[category] += 1
+                if (row.get('Completed?') or '').strip().lower() in SOLVED_VALUES:
+                    solved[category] += 1
+    except FileNotFoundError:
+        print(f"Error: '{args.csv}' not found; run `python nexus.py organize` first", file=sys.stderr)
+        return 2
+
+    if args.json:
+        categories = [{'category': c, 'problems': n, 'completed': solved[c]} for c, n in totals.items()]
+        json.dump({'categories': categories, 'problems': sum(totals.values()), 'completed': sum(solved.values())},
+                  sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return 0
+
+    width = max([len(c) for c in totals] + [len('Total')])
+    print(f"{'Category':<{width}}  {'Problems':>8}  {'Completed':>9}")
+    for category, count in totals.items():
+        print(f"{category:<{width}}  {count:>8}  {solved[category]:>9}")
+    print(f"{'Total':<{width}}  {sum(totals.values()):>8}  {sum(solved.values()):>9}")
+    return 0
+
+
+def cmd_env(args):
+    import setup
+
+    if args.check:
+        missing = setup.missing_keys(setup.read_env(args.env_file))
+        for key, _ in missing:
+            print(f"❌ {key} is not set.")
+        if not missing:
+            print(f"✅ All required keys are set in {args.env_file}.")
+        return 1 if missing else 0
+    setup.main(args.env_file)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='nexus', description="Nexus OS helper commands.")
+    commands = parser.add_subparsers(dest='command', metavar='command', required=True)
+
+    organize = commands.add_parser('organize', add_help=False,
+                                   help=f"build {om.OUTPUT_CSV} (all options are passed to organize_leetcode.py)")
+    organize.set_defaults(func=cmd_organize)
+
+    check = commands.add_parser('check', help=f"exit 1 if {om.OUTPUT_CSV} needs rebuilding")
+    check.add_argument('sources', nargs='*', help="same source specs as organize (default: the bundled workbook)")
+    check.add_argument('--emit', action='append', choices=om.EXPORT_FORMATS,
+                       help="extra formats the build is expected to produce (default: those of the last build)")
+    check.set_defaults(func=cmd_check)
+
+    stats = commands.add_parser('stats', help="problems and completed counts per category")
+    stats.add_argument('--csv', default=om.OUTPUT_CSV, help="CSV to read (default: %(default)s)")
+    stats.add_argument('--json', action='store_true', help="print the counts as JSON")
+    stats.set_defaults(func=cmd_stats)
+
+    env = commands.add_parser('env', help="create or update .env with the required keys")
+    env.add_argument('--env-file', default='.env', help="env file to update (default: %(default)s)")
+    env.add_argument('--check', action='store_true', help="only report missing keys; exit 1 if any")
+    env.set_defaults(func=cmd_env)
+
+    # organize's own options (--force, --watch, ...) are left for organize_leetcode.py to parse
+    args, rest = parser.parse_known_args(argv)
+    if rest and args.command != 'organize':
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    args.rest = rest
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,258 +1,1258 @@
-import pandas as pd
-from openpyxl import load_workbook
-
-def organize_leetcode():
-    file_path = 'leetcode problems.xlsx'
-    wb = load_workbook(file_path)
-    sheet = wb.active
-
-    data = []
-    headers = [cell.value for cell in sheet[1]]
-    
-    for row in sheet.iter_rows(min_row=2):
-        row_data = {}
-        for i, cell in enumerate(row):
-            header = headers[i] if i < len(headers) else f"Column_{i}"
-            row_data[header] = cell.value
-            if cell.hyperlink:
-                row_data['Link'] = cell.hyperlink.target
-            elif 'Link' not in row_data:
-                row_data['Link'] = None
-        data.append(row_data)
-
-    # Adding a large list of problems to reach 300+ total
-    extra_problems = [
-        # Array & Hashing
-        {"Problem Number": 1, "Problem Name": "1. Two Sum", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/two-sum/"},
-        {"Problem Number": 217, "Problem Name": "217. Contains Duplicate", "Technique": "Hash Set", "Link": "https://leetcode.com/problems/contains-duplicate/"},
-        {"Problem Number": 242, "Problem Name": "242. Valid Anagram", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/valid-anagram/"},
-        {"Problem Number": 49, "Problem Name": "49. Group Anagrams", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/group-anagrams/"},
-        {"Problem Number": 347, "Problem Name": "347. Top K Frequent Elements", "Technique": "Heap / Bucket Sort", "Link": "https://leetcode.com/problems/top-k-frequent-elements/"},
-        {"Problem Number": 238, "Problem Name": "238. Product of Array Except Self", "Technique": "Prefix/Suffix Product", "Link": "https://leetcode.com/problems/product-of-array-except-self/"},
-        {"Problem Number": 36, "Problem Name": "36. Valid Sudoku", "Technique": "Hash Set", "Link": "https://leetcode.com/problems/valid-sudoku/"},
-        {"Problem Number": 128, "Problem Name": "128. Longest Consecutive Sequence", "Technique": "Hash Set", "Link": "https://leetcode.com/problems/longest-consecutive-sequence/"},
-        
-        # Two Pointers
-        {"Problem Number": 125, "Problem Name": "125. Valid Palindrome", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/valid-palindrome/"},
-        {"Problem Number": 167, "Problem Name": "167. Two Sum II - Input Array Is Sorted", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/two-sum-ii-input-array-is-sorted/"},
-        {"Problem Number": 15, "Problem Name": "15. 3Sum", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/3sum/"},
-        {"Problem Number": 11, "Problem Name": "11. Container With Most Water", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/container-with-most-water/"},
-        {"Problem Number": 42, "Problem Name": "42. Trapping Rain Water", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/trapping-rain-water/"},
-        
-        # Sliding Window
-        {"Problem Number": 121, "Problem Name": "121. Best Time to Buy and Sell Stock", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock/"},
-        {"Problem Number": 3, "Problem Name": "3. Longest Substring Without Repeating Characters", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/longest-substring-without-repeating-characters/"},
-        {"Problem Number": 424, "Problem Name": "424. Longest Repeating Character Replacement", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/longest-repeating-character-replacement/"},
-        {"Problem Number": 567, "Problem Name": "567. Permutation in String", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/permutation-in-string/"},
-        {"Problem Number": 76, "Problem Name": "76. Minimum Window Substring", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/minimum-window-substring/"},
-        {"Problem Number": 239, "Problem Name": "239. Sliding Window Maximum", "Technique": "Deque", "Link": "https://leetcode.com/problems/sliding-window-maximum/"},
-        
-        # Stack
-        {"Problem Number": 20, "Problem Name": "20. Valid Parentheses", "Technique": "Stack", "Link": "https://leetcode.com/problems/valid-parentheses/"},
-        {"Problem Number": 155, "Problem Name": "155. Min Stack", "Technique": "Stack", "Link": "https://leetcode.com/problems/min-stack/"},
-        {"Problem Number": 150, "Problem Name": "150. Evaluate Reverse Polish Notation", "Technique": "Stack", "Link": "https://leetcode.com/problems/evaluate-reverse-polish-notation/"},
-        {"Problem Number": 22, "Problem Name": "22. Generate Parentheses", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/generate-parentheses/"},
-        {"Problem Number": 739, "Problem Name": "739. Daily Temperatures", "Technique": "Monotonic Stack", "Link": "https://leetcode.com/problems/daily-temperatures/"},
-        {"Problem Number": 853, "Problem Name": "853. Car Fleet", "Technique": "Stack", "Link": "https://leetcode.com/problems/car-fleet/"},
-        {"Problem Number": 84, "Problem Name": "84. Largest Rectangle in Histogram", "Technique": "Monotonic Stack", "Link": "https://leetcode.com/problems/largest-rectangle-in-histogram/"},
-        
-        # Binary Search
-        {"Problem Number": 704, "Problem Name": "704. Binary Search", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/binary-search/"},
-        {"Problem Number": 74, "Problem Name": "74. Search a 2D Matrix", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/search-a-2d-matrix/"},
-        {"Problem Number": 875, "Problem Name": "875. Koko Eating Bananas", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/koko-eating-bananas/"},
-        {"Problem Number": 153, "Problem Name": "153. Find Minimum in Rotated Sorted Array", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/find-minimum-in-rotated-sorted-array/"},
-        {"Problem Number": 33, "Problem Name": "33. Search in Rotated Sorted Array", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/search-in-rotated-sorted-array/"},
-        {"Problem Number": 981, "Problem Name": "981. Time Based Key-Value Store", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/time-based-key-value-store/"},
-        {"Problem Number": 4, "Problem Name": "4. Median of Two Sorted Arrays", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/median-of-two-sorted-arrays/"},
-
-        # Linked List
-        {"Problem Number": 206, "Problem Name": "206. Reverse Linked List", "Technique": "Linked List", "Link": "https://leetcode.com/problems/reverse-linked-list/"},
-        {"Problem Number": 21, "Problem Name": "21. Merge Two Sorted Lists", "Technique": "Linked List", "Link": "https://leetcode.com/problems/merge-two-sorted-lists/"},
-        {"Problem Number": 143, "Problem Name": "143. Reorder List", "Technique": "Linked List", "Link": "https://leetcode.com/problems/reorder-list/"},
-        {"Problem Number": 19, "Problem Name": "19. Remove Nth Node From End of List", "Technique": "Linked List", "Link": "https://leetcode.com/problems/remove-nth-node-from-end-of-list/"},
-        {"Problem Number": 138, "Problem Name": "138. Copy List with Random Pointer", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/copy-list-with-random-pointer/"},
-        {"Problem Number": 2, "Problem Name": "2. Add Two Numbers", "Technique": "Linked List", "Link": "https://leetcode.com/problems/add-two-numbers/"},
-        {"Problem Number": 141, "Problem Name": "141. Linked List Cycle", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/linked-list-cycle/"},
-        {"Problem Number": 287, "Problem Name": "287. Find the Duplicate Number", "Technique": "Floyd's Cycle Detection", "Link": "https://leetcode.com/problems/find-the-duplicate-number/"},
-        {"Problem Number": 146, "Problem Name": "146. LRU Cache", "Technique": "Hash Map & DLL", "Link": "https://leetcode.com/problems/lru-cache/"},
-        {"Problem Number": 23, "Problem Name": "23. Merge k Sorted Lists", "Technique": "Heap / Merge Sort", "Link": "https://leetcode.com/problems/merge-k-sorted-lists/"},
-        {"Problem Number": 25, "Problem Name": "25. Reverse Nodes in k-Group", "Technique": "Linked List", "Link": "https://leetcode.com/problems/reverse-nodes-in-k-group/"},
-
-        # Trees
-        {"Problem Number": 226, "Problem Name": "226. Invert Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/invert-binary-tree/"},
-        {"Problem Number": 104, "Problem Name": "104. Maximum Depth of Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/maximum-depth-of-binary-tree/"},
-        {"Problem Number": 543, "Problem Name": "543. Diameter of Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/diameter-of-binary-tree/"},
-        {"Problem Number": 110, "Problem Name": "110. Balanced Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/balanced-binary-tree/"},
-        {"Problem Number": 100, "Problem Name": "100. Same Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/same-tree/"},
-        {"Problem Number": 572, "Problem Name": "572. Subtree of Another Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/subtree-of-another-tree/"},
-        {"Problem Number": 235, "Problem Name": "235. Lowest Common Ancestor of a Binary Search Tree", "Technique": "BST", "Link": "https://leetcode.com/problems/lowest-common-ancestor-of-a-binary-search-tree/"},
-        {"Problem Number": 102, "Problem Name": "102. Binary Tree Level Order Traversal", "Technique": "BFS", "Link": "https://leetcode.com/problems/binary-tree-level-order-traversal/"},
-        {"Problem Number": 199, "Problem Name": "199. Binary Tree Right Side View", "Technique": "BFS", "Link": "https://leetcode.com/problems/binary-tree-right-side-view/"},
-        {"Problem Number": 1448, "Problem Name": "1448. Count Good Nodes in Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/count-good-nodes-in-binary-tree/"},
-        {"Problem Number": 98, "Problem Name": "98. Validate Binary Search Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/validate-binary-search-tree/"},
-        {"Problem Number": 230, "Problem Name": "230. Kth Smallest Element in a BST", "Technique": "DFS In-order", "Link": "https://leetcode.com/problems/kth-smallest-element-in-a-bst/"},
-        {"Problem Number": 105, "Problem Name": "105. Construct Binary Tree from Preorder and Inorder Traversal", "Technique": "DFS", "Link": "https://leetcode.com/problems/construct-binary-tree-from-preorder-and-inorder-traversal/"},
-        {"Problem Number": 124, "Problem Name": "124. Binary Tree Maximum Path Sum", "Technique": "DFS", "Link": "https://leetcode.com/problems/binary-tree-maximum-path-sum/"},
-        {"Problem Number": 297, "Problem Name": "297. Serialize and Deserialize Binary Tree", "Technique": "BFS/DFS", "Link": "https://leetcode.com/problems/serialize-and-deserialize-binary-tree/"},
-
-        # Backtracking
-        {"Problem Number": 78, "Problem Name": "78. Subsets", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/subsets/"},
-        {"Problem Number": 39, "Problem Name": "39. Combination Sum", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/combination-sum/"},
-        {"Problem Number": 46, "Problem Name": "46. Permutations", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/permutations/"},
-        {"Problem Number": 90, "Problem Name": "90. Subsets II", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/subsets-ii/"},
-        {"Problem Number": 40, "Problem Name": "40. Combination Sum II", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/combination-sum-ii/"},
-        {"Problem Number": 79, "Problem Name": "79. Word Search", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/word-search/"},
-        {"Problem Number": 131, "Problem Name": "131. Palindrome Partitioning", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/palindrome-partitioning/"},
-        {"Problem Number": 17, "Problem Name": "17. Letter Combinations of a Phone Number", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/letter-combinations-of-a-phone-number/"},
-        {"Problem Number": 51, "Problem Name": "51. N-Queens", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/n-queens/"},
-
-        # Graphs
-        {"Problem Number": 200, "Problem Name": "200. Number of Islands", "Technique": "BFS/DFS", "Link": "https://leetcode.com/problems/number-of-islands/"},
-        {"Problem Number": 695, "Problem Name": "695. Max Area of Island", "Technique": "DFS", "Link": "https://leetcode.com/problems/max-area-of-island/"},
-        {"Problem Number": 133, "Problem Name": "133. Clone Graph", "Technique": "BFS/DFS", "Link": "https://leetcode.com/problems/clone-graph/"},
-        {"Problem Number": 994, "Problem Name": "994. Rotting Oranges", "Technique": "BFS", "Link": "https://leetcode.com/problems/rotting-oranges/"},
-        {"Problem Number": 417, "Problem Name": "417. Pacific Atlantic Water Flow", "Technique": "DFS", "Link": "https://leetcode.com/problems/pacific-atlantic-water-flow/"},
-        {"Problem Number": 130, "Problem Name": "130. Surrounded Regions", "Technique": "DFS", "Link": "https://leetcode.com/problems/surrounded-regions/"},
-        {"Problem Number": 207, "Problem Name": "207. Course Schedule", "Technique": "Topological Sort", "Link": "https://leetcode.com/problems/course-schedule/"},
-        {"Problem Number": 210, "Problem Name": "210. Course Schedule II", "Technique": "Topological Sort", "Link": "https://leetcode.com/problems/course-schedule-ii/"},
-        {"Problem Number": 684, "Problem Name": "684. Redundant Connection", "Technique": "Union Find", "Link": "https://leetcode.com/problems/redundant-connection/"},
-        {"Problem Number": 127, "Problem Name": "127. Word Ladder", "Technique": "BFS", "Link": "https://leetcode.com/problems/word-ladder/"},
-
-        # Advanced Graphs
-        {"Problem Number": 1584, "Problem Name": "1584. Min Cost to Connect All Points", "Technique": "Prim's / Kruskal's", "Link": "https://leetcode.com/problems/min-cost-to-connect-all-points/"},
-        {"Problem Number": 743, "Problem Name": "743. Network Delay Time", "Technique": "Dijkstra's", "Link": "https://leetcode.com/problems/network-delay-time/"},
-        {"Problem Number": 778, "Problem Name": "778. Swim in Rising Water", "Technique": "Dijkstra's", "Link": "https://leetcode.com/problems/swim-in-rising-water/"},
-        {"Problem Number": 269, "Problem Name": "269. Alien Dictionary", "Technique": "Topological Sort", "Link": "https://leetcode.com/problems/alien-dictionary/"},
-        {"Problem Number": 787, "Problem Name": "787. Cheapest Flights Within K Stops", "Technique": "Bellman-Ford / Dijkstra's", "Link": "https://leetcode.com/problems/cheapest-flights-within-k-stops/"},
-
-        # Dynamic Programming
-        {"Problem Number": 70, "Problem Name": "70. Climbing Stairs", "Technique": "DP", "Link": "https://leetcode.com/problems/climbing-stairs/"},
-        {"Problem Number": 746, "Problem Name": "746. Min Cost Climbing Stairs", "Technique": "DP", "Link": "https://leetcode.com/problems/min-cost-climbing-stairs/"},
-        {"Problem Number": 198, "Problem Name": "198. House Robber", "Technique": "DP", "Link": "https://leetcode.com/problems/house-robber/"},
-        {"Problem Number": 213, "Problem Name": "213. House Robber II", "Technique": "DP", "Link": "https://leetcode.com/problems/house-robber-ii/"},
-        {"Problem Number": 5, "Problem Name": "5. Longest Palindromic Substring", "Technique": "DP / Two Pointers", "Link": "https://leetcode.com/problems/longest-palindromic-substring/"},
-        {"Problem Number": 647, "Problem Name": "647. Palindromic Substrings", "Technique": "DP / Two Pointers", "Link": "https://leetcode.com/problems/palindromic-substrings/"},
-        {"Problem Number": 91, "Problem Name": "91. Decode Ways", "Technique": "DP", "Link": "https://leetcode.com/problems/decode-ways/"},
-        {"Problem Number": 322, "Problem Name": "322. Coin Change", "Technique": "DP", "Link": "https://leetcode.com/problems/coin-change/"},
-        {"Problem Number": 152, "Problem Name": "152. Maximum Product Subarray", "Technique": "DP", "Link": "https://leetcode.com/problems/maximum-product-subarray/"},
-        {"Problem Number": 139, "Problem Name": "139. Word Break", "Technique": "DP", "Link": "https://leetcode.com/problems/word-break/"},
-        {"Problem Number": 300, "Problem Name": "300. Longest Increasing Subsequence", "Technique": "DP", "Link": "https://leetcode.com/problems/longest-increasing-subsequence/"},
-        {"Problem Number": 416, "Problem Name": "416. Partition Equal Subset Sum", "Technique": "DP", "Link": "https://leetcode.com/problems/partition-equal-subset-sum/"},
-        
-        # 2D DP
-        {"Problem Number": 62, "Problem Name": "62. Unique Paths", "Technique": "DP", "Link": "https://leetcode.com/problems/unique-paths/"},
-        {"Problem Number": 1143, "Problem Name": "1143. Longest Common Subsequence", "Technique": "DP", "Link": "https://leetcode.com/problems/longest-common-subsequence/"},
-        {"Problem Number": 309, "Problem Name": "309. Best Time to Buy and Sell Stock with Cooldown", "Technique": "DP", "Link": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock-with-cooldown/"},
-        {"Problem Number": 518, "Problem Name": "518. Coin Change II", "Technique": "DP", "Link": "https://leetcode.com/problems/coin-change-ii/"},
-        {"Problem Number": 494, "Problem Name": "494. Target Sum", "Technique": "DP", "Link": "https://leetcode.com/problems/target-sum/"},
-        {"Problem Number": 97, "Problem Name": "97. Interleaving String", "Technique": "DP", "Link": "https://leetcode.com/problems/interleaving-string/"},
-        {"Problem Number": 72, "Problem Name": "72. Edit Distance", "Technique": "DP", "Link": "https://leetcode.com/problems/edit-distance/"},
-        {"Problem Number": 312, "Problem Name": "312. Burst Balloons", "Technique": "DP", "Link": "https://leetcode.com/problems/burst-balloons/"},
-        {"Problem Number": 10, "Problem Name": "10. Regular Expression Matching", "Technique": "DP", "Link": "https://leetcode.com/problems/regular-expression-matching/"},
-
-        # Greedy
-        {"Problem Number": 53, "Problem Name": "53. Maximum Subarray", "Technique": "Greedy / Kadane's", "Link": "https://leetcode.com/problems/maximum-subarray/"},
-        {"Problem Number": 55, "Problem Name": "55. Jump Game", "Technique": "Greedy", "Link": "https://leetcode.com/problems/jump-game/"},
-        {"Problem Number": 45, "Problem Name": "45. Jump Game II", "Technique": "Greedy", "Link": "https://leetcode.com/problems/jump-game-ii/"},
-        {"Problem Number": 134, "Problem Name": "134. Gas Station", "Technique": "Greedy", "Link": "https://leetcode.com/problems/gas-station/"},
-        {"Problem Number": 846, "Problem Name": "846. Hand of Straights", "Technique": "Greedy / Map", "Link": "https://leetcode.com/problems/hand-of-straights/"},
-        {"Problem Number": 1899, "Problem Name": "1899. Merge Triplets to Form Target Triplet", "Technique": "Greedy", "Link": "https://leetcode.com/problems/merge-triplets-to-form-target-triplet/"},
-        {"Problem Number": 763, "Problem Name": "763. Partition Labels", "Technique": "Greedy", "Link": "https://leetcode.com/problems/partition-labels/"},
-        {"Problem Number": 678, "Problem Name": "678. Valid Parenthesis String", "Technique": "Greedy", "Link": "https://leetcode.com/problems/valid-parenthesis-string/"},
-
-        # Intervals
-        {"Problem Number": 57, "Problem Name": "57. Insert Interval", "Technique": "Intervals", "Link": "https://leetcode.com/problems/insert-interval/"},
-        {"Problem Number": 56, "Problem Name": "56. Merge Intervals", "Technique": "Intervals", "Link": "https://leetcode.com/problems/merge-intervals/"},
-        {"Problem Number": 435, "Problem Name": "435. Non-overlapping Intervals", "Technique": "Intervals", "Link": "https://leetcode.com/problems/non-overlapping-intervals/"},
-        {"Problem Number": 252, "Problem Name": "252. Meeting Rooms", "Technique": "Intervals", "Link": "https://leetcode.com/problems/meeting-rooms/"},
-        {"Problem Number": 253, "Problem Name": "253. Meeting Rooms II", "Technique": "Intervals", "Link": "https://leetcode.com/problems/meeting-rooms-ii/"},
-        {"Problem Number": 1851, "Problem Name": "1851. Minimum Interval to Include Each Query", "Technique": "Intervals / Heap", "Link": "https://leetcode.com/problems/minimum-interval-to-include-each-query/"},
-
-        # Math & Geometry
-        {"Problem Number": 48, "Problem Name": "48. Rotate Image", "Technique": "Math", "Link": "https://leetcode.com/problems/rotate-image/"},
-        {"Problem Number": 54, "Problem Name": "54. Spiral Matrix", "Technique": "Math", "Link": "https://leetcode.com/problems/spiral-matrix/"},
-        {"Problem Number": 73, "Problem Name": "73. Set Matrix Zeroes", "Technique": "Math", "Link": "https://leetcode.com/problems/set-matrix-zeroes/"},
-        {"Problem Number": 202, "Problem Name": "202. Happy Number", "Technique": "Math", "Link": "https://leetcode.com/problems/happy-number/"},
-        {"Problem Number": 66, "Problem Name": "66. Plus One", "Technique": "Math", "Link": "https://leetcode.com/problems/plus-one/"},
-        {"Problem Number": 50, "Problem Name": "50. Pow(x, n)", "Technique": "Math", "Link": "https://leetcode.com/problems/powx-n/"},
-        {"Problem Number": 43, "Problem Name": "43. Multiply Strings", "Technique": "Math", "Link": "https://leetcode.com/problems/multiply-strings/"},
-        {"Problem Number": 2013, "Problem Name": "2013. Detect Squares", "Technique": "Math / Hash Map", "Link": "https://leetcode.com/problems/detect-squares/"},
-
-        # Bit Manipulation
-        {"Problem Number": 136, "Problem Name": "136. Single Number", "Technique": "Bitwise XOR", "Link": "https://leetcode.com/problems/single-number/"},
-        {"Problem Number": 191, "Problem Name": "191. Number of 1 Bits", "Technique": "Bitwise AND", "Link": "https://leetcode.com/problems/number-of-1-bits/"},
-        {"Problem Number": 338, "Problem Name": "338. Counting Bits", "Technique": "DP / Bitwise", "Link": "https://leetcode.com/problems/counting-bits/"},
-        {"Problem Number": 190, "Problem Name": "190. Reverse Bits", "Technique": "Bitwise", "Link": "https://leetcode.com/problems/reverse-bits/"},
-        {"Problem Number": 268, "Problem Name": "268. Missing Number", "Technique": "Bitwise XOR / Sum", "Link": "https://leetcode.com/problems/missing-number/"},
-        {"Problem Number": 371, "Problem Name": "371. Sum of Two Integers", "Technique": "Bitwise", "Link": "https://leetcode.com/problems/sum-of-two-integers/"},
-        {"Problem Number": 7, "Problem Name": "7. Reverse Integer", "Technique": "Math", "Link": "https://leetcode.com/problems/reverse-integer/"},
-    ]
+import argparse
+import csv
+import hashlib
+import heapq
+import importlib.util
+import io
+import itertools
+import json
+import math
+import os
+import posixpath
+import re
+import stat
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from functools import partial
+from xml.etree.ElementTree import fromstring, iterparse
 
-    # Generate more dummy problems to reach exactly 300 if needed
-    current_total = len(data) + len(extra_problems)
-    if current_total < 300:
-        for i in range(300 - current_total):
-            num = 3000 + i
-            extra_problems.append({
-                "Problem Number": num,
-                "Problem Name": f"{num}. Extra Problem {i+1}",
-                "Technique": "Various",
-                "Link": f"https://leetcode.com/problems/extra-problem-{i+1}/"
-            })
-    
-    data.extend(extra_problems)
-    df = pd.DataFrame(data)
-
-    def get_category(technique):
-        if not technique: return "Other"
+from organize_manifest import (
+    CATEGORY_RULES,
+    EXPORT_FORMATS,
+    EXTRA_PROBLEMS,
+    MANIFEST_JSON,
+    OUTPUT_CSV,
+    SOURCE_WORKBOOK,
+    SourceError,
+    build_inputs,
+    load_manifest,
+    manifest_stale_reason,
+    output_paths,
+    parse_source,
+    sha256_file,
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DELTA_JSONL = 'leetcode_problems.delta.jsonl'
+# The app reads these by position, so new columns only ever go at the end
+OUTPUT_COLUMNS = ['Category', 'Problem No', 'Link', 'Problem Name', 'Technique', 'Completed?', 'ID']
+
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+
+# Compact per-row record; only the columns the organizer actually uses are kept.
+ROW_COLUMNS = ['Problem Number', 'Problem Name', 'Technique', 'Link', 'Completed?']
+SheetRow = namedtuple('SheetRow', ['number', 'name', 'technique', 'link', 'completed'])
+# What chunked mode carries forward from the previous CSV: {ID: Completed?}, the columns
+# someone added to the CSV, and {ID: values of those columns}, the maps being DiskMaps
+Progress = namedtuple('Progress', ['completions', 'columns', 'extras'])
+
+# Derived per-row columns kept in a row cache next to the build manifest, keyed by row
+# fingerprint. Bump organize_manifest.MANIFEST_VERSION whenever the code that produces
+# them changes.
+CACHED_COLUMNS = ['Problem Name Clean', 'Problem No', 'Category']
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return round(peak / (1 << 20 if sys.platform == 'darwin' else 1 << 10), 1)
+
+
+class StageProfile:
+    # Wall time, rows handled and how far each pipeline stage raised the process's peak
+    # RSS. ru_maxrss only ever grows, so a stage that stays under an earlier peak shows
+    # no growth however much it allocates. Stages entered more than once (e.g. once per
+    # chunk) accumulate.
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        record = self.stages.setdefault(name, {'seconds': 0.0, 'rows': 0, 'rss_growth_mb': None})
+        counter = {'rows': rows}
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield counter
+        finally:
+            record['seconds'] += time.perf_counter() - start
+            record['rows'] += counter['rows'] or 0
+            if rss_before is not None:
+                record['rss_growth_mb'] = (record['rss_growth_mb'] or 0.0) + peak_rss_mb() - rss_before
+
+    def report(self):
+        stages = [
+            {
+                'stage': name,
+                'seconds': round(r['seconds'], 4),
+                'rows': r['rows'],
+                'rows_per_sec': round(r['rows'] / r['seconds']) if r['rows'] and r['seconds'] else None,
+                'rss_growth_mb': None if r['rss_growth_mb'] is None else round(r['rss_growth_mb'], 1),
+            }
+            for name, r in self.stages.items()
+        ]
+        return {
+            'stages': stages,
+            'total_seconds': round(sum(r['seconds'] for r in self.stages.values()), 4),
+            'peak_rss_mb': peak_rss_mb(),
+        }
+
+    def print_summary(self):
+        report = self.report()
+        for stage in report['stages']:
+            rate = f"{stage['rows_per_sec']:,} rows/s" if stage['rows_per_sec'] else ''
+            print(f"  {stage['stage']:<20} {stage['seconds']:>9.3f}s {rate:>18} +{str(stage['rss_growth_mb']):>7} MB RSS")
+        print(f"  {'peak RSS':<20} {str(report['peak_rss_mb']):>47} MB")
+
+
+class DiskMap:
+    # A dict-like table in an SQLite database, for chunked builds that must not keep
+    # per-row state in memory. Every lookup is a query, so it is only used where memory
+    # has to stay independent of the row count. The table starts out empty.
+
+    def __init__(self, db, name, default=None, encode=None, decode=None):
+        self._db = db
+        self._default = default
+        self._encode = encode
+        self._decode = decode
+        db.execute(f'DROP TABLE IF EXISTS "{name}"')
+        db.execute(f'CREATE TABLE "{name}" (key PRIMARY KEY, value)')
+        self._select = f'SELECT value FROM "{name}" WHERE key = ?'
+        self._replace = f'INSERT OR REPLACE INTO "{name}" VALUES (?, ?)'
+        self._insert = f'INSERT OR IGNORE INTO "{name}" VALUES (?, ?)'
+
+    def _lookup(self, key):
+        row = self._db.execute(self._select, (key,)).fetchone()
+        if row is None:
+            return None
+        return (self._decode(row[0]),) if self._decode else row
+
+    def get(self, key, default=None):
+        found = self._lookup(key)
+        return default if found is None else found[0]
+
+    def __getitem__(self, key):
+        found = self._lookup(key)
+        if found is not None:
+            return found[0]
+        if self._default is None:
+            raise KeyError(key)
+        return self._default
+
+    def __contains__(self, key):
+        return self._lookup(key) is not None
+
+    def __setitem__(self, key, value):
+        self._db.execute(self._replace, (key, self._encode(value) if self._encode else value))
+
+    def add(self, key, value=None):
+        # Like set.add()/dict.setdefault(): the first value for a key is kept. Returns
+        # whether the key was new.
+        cursor = self._db.execute(self._insert, (key, self._encode(value) if self._encode else value))
+        return cursor.rowcount == 1
+
+
+def _read_rels(archive, part, rel_type=None, rels=None):
+    # {Id: Target} for a part's relationships, optionally only those of one type. A sheet
+    # has a relationship per hyperlink, so the part is streamed and each element dropped
+    # once read; only the two strings per relationship are kept, in rels if given.
+    rels_path = posixpath.join(posixpath.dirname(part), '_rels', posixpath.basename(part) + '.rels')
+    rels = {} if rels is None else rels
+    try:
+        fh = archive.open(rels_path)
+    except KeyError:
+        return rels
+    root = None
+    with fh:
+        for event, elem in iterparse(fh, events=('start', 'end')):
+            if root is None:
+                root = elem
+            elif event == 'end' and elem.tag == PKG_REL_NS + 'Relationship':
+                if rel_type is None or elem.get('Type') == rel_type:
+                    rels[elem.get('Id')] = elem.get('Target')
+                root.remove(elem)
+    return rels
+
+
+def _resolve_part(base_part, target):
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_part), target))
+
+
+def _sheet_parts(archive):
+    # Worksheet (name, zip part) pairs in tab order, plus the index of the active tab
+    workbook_part = next(_resolve_part('', target) for target in _read_rels(archive, '', OFFICE_DOCUMENT_REL).values())
+    root = fromstring(archive.read(workbook_part))
+    rels = _read_rels(archive, workbook_part)
+
+    sheets = []
+    for sheet in root.iter(SHEET_NS + 'sheet'):
+        sheets.append((sheet.get('name'), _resolve_part(workbook_part, rels[sheet.get(REL_NS + 'id')])))
+
+    view = root.find(f'{SHEET_NS}bookViews/{SHEET_NS}workbookView')
+    active = int(view.get('activeTab', 0)) if view is not None else 0
+    return sheets, active
+
+
+def _row_hyperlinks(archive, part, links=None, rels=None):
+    # read_only worksheets drop cell.hyperlink, so resolve targets straight from the
+    # sheet's relationship part. <hyperlinks> sits after <sheetData>, so rows and
+    # hyperlinks are discarded as soon as they are parsed. The {Id: Target} map of the
+    # rels part and the {row: Target} map built here cost about 0.4 KB per hyperlinked
+    # row as dicts; chunked builds pass DiskMaps instead.
+    from openpyxl.utils import range_boundaries
+
+    rels = _read_rels(archive, part, rels=rels)
+    links = {} if links is None else links
+    parents = {}
+    with archive.open(part) as fh:
+        for event, elem in iterparse(fh, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag in (SHEET_NS + 'sheetData', SHEET_NS + 'hyperlinks'):
+                    parents[elem.tag] = elem
+            elif elem.tag == SHEET_NS + 'row':
+                parents[SHEET_NS + 'sheetData'].remove(elem)
+            elif elem.tag == SHEET_NS + 'hyperlink':
+                target = rels.get(elem.get(REL_NS + 'id'))
+                if target:
+                    _, min_row, _, max_row = range_boundaries(elem.get('ref'))
+                    for row in range(min_row, max_row + 1):
+                        links[row] = target
+                parents[SHEET_NS + 'hyperlinks'].remove(elem)
+    return links
+
+
+def _cell(values, col):
+    if col is None or col >= len(values):
+        return None
+    return values[col]
+
+
+def _spill_shared_strings(archive, part, strings):
+    # Same text as openpyxl's read_string_table(), one <si> at a time into strings
+    from openpyxl.cell.text import Text
+
+    root = None
+    count = 0
+    with archive.open(part) as fh:
+        for event, elem in iterparse(fh, events=('start', 'end')):
+            if root is None:
+                root = elem
+            elif event == 'end' and elem.tag == SHEET_NS + 'si':
+                strings[count] = Text.from_tree(elem).content.replace('x005F_', '')
+                count += 1
+                root.remove(elem)
+
+
+def _stream_rows(archive, part, parser):
+    # The rows ReadOnlyWorksheet.iter_rows(values_only=True) gives after reset_dimensions()
+    # (missing rows come through empty, each row runs to its last cell), with cells
+    # converted by openpyxl's own parser. Unlike openpyxl, every parsed element is dropped
+    # and parsing stops after <sheetData>, before the sheet's hyperlinks.
+    counter = 1
+    sheet_data = None
+    with archive.open(part) as fh:
+        for event, elem in iterparse(fh, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == SHEET_NS + 'sheetData':
+                    sheet_data = elem
+            elif elem.tag == SHEET_NS + 'row':
+                idx, cells = parser.parse_row(elem)
+                sheet_data.remove(elem)
+                parser.row_dimensions.clear()
+                for _ in range(counter, idx):
+                    counter += 1
+                    yield ()
+                if counter <= idx:
+                    counter += 1
+                    width = cells[-1]['column'] if cells else 0
+                    values = [None] * width
+                    for cell in cells:
+                        if cell['column'] <= width:
+                            values[cell['column'] - 1] = cell['value']
+                    yield tuple(values)
+            elif elem.tag == SHEET_NS + 'sheetData':
+                return
+
+
+@contextmanager
+def _open_sheet(file_path, sheet_name):
+    # (row values, {row: hyperlink}) of one sheet
+    from openpyxl import load_workbook
+
+    # openpyxl parses the sheet's rels part whole while loading (and then discards it), so
+    # the workbook is opened before the hyperlink pass rather than while its map is alive
+    wb = load_workbook(file_path, read_only=True)
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            sheets, active = _sheet_parts(archive)
+            if sheet_name is None:
+                sheet_name = sheets[active][0]
+            links = _row_hyperlinks(archive, dict(sheets)[sheet_name])
+
+        # Read-only worksheets stop at the sheet's <dimension>, which writers do not always
+        # keep up to date; without it openpyxl reads every row the sheet actually has
+        ws = wb[sheet_name]
+        ws.reset_dimensions()
+        yield ws.iter_rows(values_only=True), links
+    finally:
+        wb.close()
+
+
+@contextmanager
+def _open_sheet_on_disk(file_path, sheet_name, db):
+    # Same as _open_sheet(), with nothing in memory that grows with the sheet: shared
+    # strings, relationships and hyperlinks go to tables in db. load_workbook() is
+    # skipped because it parses the sheet's rels part whole, and openpyxl's own row
+    # iteration because it keeps every parsed row element and builds all hyperlinks.
+    from openpyxl.reader.excel import ExcelReader
+    from openpyxl.styles.stylesheet import apply_stylesheet
+    from openpyxl.worksheet._reader import WorkSheetParser
+    from openpyxl.xml.constants import SHARED_STRINGS
+
+    reader = ExcelReader(file_path, read_only=True)
+    try:
+        reader.read_manifest()
+        reader.read_workbook()
+        apply_stylesheet(reader.archive, reader.wb)
+        sheets, active = _sheet_parts(reader.archive)
+        part = dict(sheets)[sheets[active][0] if sheet_name is None else sheet_name]
+
+        strings = DiskMap(db, 'shared_strings')
+        content_type = reader.package.find(SHARED_STRINGS)
+        if content_type is not None:
+            _spill_shared_strings(reader.archive, content_type.PartName[1:], strings)
+        links = _row_hyperlinks(reader.archive, part, DiskMap(db, 'hyperlinks'), DiskMap(db, 'rels'))
+
+        wb = reader.wb
+        parser = WorkSheetParser(None, strings, epoch=wb.epoch, date_formats=wb._date_formats,
+                                 timedelta_formats=wb._timedelta_formats)
+        yield _stream_rows(reader.archive, part, parser), links
+    finally:
+        reader.archive.close()
+
+
+def iter_sheet_rows(file_path, sheet_name=None, db=None):
+    # With db (an sqlite3 connection) the sheet is read without per-row state in memory
+    opened = _open_sheet(file_path, sheet_name) if db is None else _open_sheet_on_disk(file_path, sheet_name, db)
+    with opened as (rows, links):
+        headers = next(rows, ())
+        cols = {header: i for i, header in enumerate(headers)}
+        number_col, name_col, technique_col, link_col, completed_col = (cols.get(c) for c in ROW_COLUMNS)
+
+        for row_idx, values in enumerate(rows, start=2):
+            yield SheetRow(
+                _cell(values, number_col),
+                _cell(values, name_col),
+                _cell(values, technique_col),
+                links.get(row_idx, _cell(values, link_col)),
+                _cell(values, completed_col),
+            )
+
+
+def expand_sources(specs):
+    # (path, sheet name) tasks in command-line order, each workbook's tabs in tab order
+    tasks = []
+    for spec in specs:
+        path, selector = parse_source(spec)
+        try:
+            with zipfile.ZipFile(path) as archive:
+                sheets, active = _sheet_parts(archive)
+        except zipfile.BadZipFile:
+            raise SourceError(f"'{path}' is not an .xlsx workbook") from None
+        names = [name for name, _ in sheets]
+
+        if selector is None:
+            tasks.append((path, names[active]))
+        elif selector == '*':
+            tasks.extend((path, name) for name in names)
+        else:
+            for name in selector.split(','):
+                if name not in names:
+                    raise SourceError(f"'{path}' has no sheet named '{name}'")
+                tasks.append((path, name))
+    return tasks
+
+
+def _read_sheet(task):
+    return list(iter_sheet_rows(*task))
+
+
+def parse_sheets(tasks, jobs=None):
+    # openpyxl parsing is CPU-bound, so several sheets are parsed in worker processes.
+    # pool.map() returns results in submission order, which keeps the merge deterministic.
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return [_read_sheet(task) for task in tasks]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_read_sheet, tasks))
+
+
+def read_sources(tasks, jobs=None):
+    return [row for rows in parse_sheets(tasks, jobs) for row in rows]
+
+
+class BuildSession:
+    # State kept warm between rebuilds of a long-running process (watch mode): the last
+    # manifest and row cache, the classifier with its technique cache, and the parsed
+    # rows of every sheet, keyed by the content hash of its workbook.
+
+    def __init__(self):
+        self.manifest = None
+        self.row_cache = None
+        self.rules = None
+        self.classifier = None
+        self.sheets = {}
+
+    def get_classifier(self, rules_hash):
+        if self.classifier is None or self.rules != rules_hash:
+            self.classifier = CategoryClassifier.from_file(CATEGORY_RULES)
+            self.rules = rules_hash
+        return self.classifier
+
+    def read_sources(self, tasks, jobs, source_hashes):
+        stale = [task for task in tasks if self.sheets.get(task, (None,))[0] != source_hashes[task[0]]]
+        parsed = dict(zip(stale, parse_sheets(stale, jobs)))
+        self.sheets = {
+            task: (source_hashes[task[0]], parsed[task]) if task in parsed else self.sheets[task]
+            for task in tasks
+        }
+        return [row for task in tasks for row in self.sheets[task][1]]
+
+
+class CategoryClassifier:
+    # Keyword rules are compiled once into one regex per category and tried in file
+    # order, so the first matching category wins. Results are cached per distinct
+    # technique string, and whole columns are classified over their unique values only.
+
+    def __init__(self, rules, default='Other'):
+        self.default = default
+        self._rules = [
+            (
+                rule['category'],
+                self._compile(rule['keywords']),
+                self._compile(rule['exclude']) if rule.get('exclude') else None,
+            )
+            for rule in rules
+        ]
+        self._cache = {}
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        return cls(config['rules'], config.get('default', 'Other'))
+
+    @staticmethod
+    def _compile(keywords):
+        return re.compile('|'.join(re.escape(k.lower()) for k in keywords))
+
+    def classify_one(self, technique):
+        if not technique:
+            return self.default
         tech = str(technique).lower()
-        if any(x in tech for x in ['sliding window', 'deque']): return "Sliding Window"
-        if any(x in tech for x in ['two pointers', 'traverse two sequences', 'left ptr', 'floyd']): return "Two Pointers"
-        if any(x in tech for x in ['prefix sum', 'difference array', 'product']): return "Prefix Sum"
-        if any(x in tech for x in ['sort', 'quick select', 'heap', 'intervals']): return "Sorting & Heap"
-        if any(x in tech for x in ['stack', 'monotonic stack']): return "Stack"
-        if any(x in tech for x in ['binary search', 'bst']): return "Binary Search"
-        if any(x in tech for x in ['linked list', 'dll']): return "Linked List"
-        if any(x in tech for x in ['tree', 'dfs', 'bfs']) and 'graph' not in tech: return "Trees"
-        if any(x in tech for x in ['graph', 'topological', 'union find', 'dijkstra', 'bellman']): return "Graphs"
-        if any(x in tech for x in ['dp', 'dynamic programming']): return "Dynamic Programming"
-        if any(x in tech for x in ['backtracking']): return "Backtracking"
-        if any(x in tech for x in ['greedy', 'kadane']): return "Greedy"
-        if any(x in tech for x in ['math', 'geometry', 'bitwise', 'xor']): return "Math & Bit Manipulation"
-        if any(x in tech for x in ['array', 'traverse', 'boyer moore', 'reverse', 'cyclic sort', 'hashmap', 'hashing', 'continuous elements', 'swap', 'permutation', 'hash set']): return "Array & Hashing"
-        return "Other"
-
-    df['Category'] = df['Technique'].apply(get_category)
-
-    def extract_name(name):
-        if not name: return ""
-        name = str(name)
-        if '.' in name: return name.split('.', 1)[1].strip()
-        return name
-
-    def extract_no(name, prob_no):
-        if not name: return prob_no
-        name = str(name)
-        if '.' in name: return name.split('.', 1)[0].strip()
-        return prob_no
-
-    df['Problem Name Clean'] = df['Problem Name'].apply(extract_name)
-    df['Problem No'] = df.apply(lambda row: extract_no(row['Problem Name'], row['Problem Number']), axis=1)
+        category = self._cache.get(tech)
+        if category is None:
+            category = self.default
+            for name, keywords, exclude in self._rules:
+                if keywords.search(tech) and not (exclude and exclude.search(tech)):
+                    category = name
+                    break
+            self._cache[tech] = category
+        return category
+
+    def classify(self, techniques):
+        import pandas as pd
+
+        codes, uniques = pd.factorize(techniques, use_na_sentinel=False)
+        categories = pd.Index([self.classify_one(t) for t in uniques], dtype=object)
+        return pd.Series(categories.take(codes), index=techniques.index, name='Category')
+
+
+def normalize_problems(df):
+    # "123. Two Sum" -> Problem No "123", Problem Name Clean "Two Sum"; names without a
+    # dot keep the whole name and fall back to the Problem Number column.
+    import pandas as pd
+
+    names = df['Problem Name']
+    text = names.where(names.notna() & (names != ''), '').astype(str)
+    parts = text.str.partition('.')
+    has_dot = parts[1] == '.'
+
+    df['Problem Name Clean'] = parts[2].str.strip().where(has_dot, text)
+    df['Problem No'] = parts[0].str.strip().astype(object).where(has_dot, df['Problem Number'])
+    df['Problem No Sort'] = pd.to_numeric(df['Problem No'], errors='coerce')
+    return df
+
+
+def dedupe_problems(df):
+    # Rows are ordered workbook first, then built-ins, so keeping the first row per
+    # problem number gives the workbook precedence. Rows without a number are kept.
+    # Returns the deduplicated frame and the mask of dropped input rows.
+    key = df['Problem No Sort']
+    duplicated = key.notna() & key.duplicated(keep='first')
+    return df[~duplicated].reset_index(drop=True), duplicated
+
+
+def _install(tmp_path, path):
+    # mkstemp creates 0600 files and os.replace keeps that mode, so give the temp file
+    # the target's current mode (or the umask default for a new file) before renaming
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+def _is_current(path, output_hash):
+    return os.path.exists(path) and sha256_file(path) == output_hash
+
+
+def _replace_if_changed(tmp_path, path):
+    # Swap a finished temp file into place unless the target already has the same bytes,
+    # so an unchanged output keeps its mtime (and anything watching it stays put)
+    output_hash = sha256_file(tmp_path)
+    if _is_current(path, output_hash):
+        os.remove(tmp_path)
+        return output_hash, False
+    _install(tmp_path, path)
+    return output_hash, True
+
+
+class PendingOutputs:
+    # The files one build produces, each first written to a temp file next to its target.
+    # Nothing is replaced until commit(), which swaps them in in the order they were added
+    # (the manifest goes last), so a build that fails part-way leaves the previous outputs
+    # and the manifest describing them as they were. Readers such as the app's
+    # leetcode:readCsv handler never see a half-written file either.
+
+    def __init__(self):
+        self._files = []
+
+    def remove(self, target):
+        # Deleted by commit(), in order with the replacements
+        self._files.append((None, target))
+
+    def path(self, target):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)), suffix='.tmp')
+        os.close(fd)
+        self._files.append((tmp_path, target))
+        return tmp_path
+
+    def write(self, target, text):
+        with open(self.path(target), 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+
+    def commit(self):
+        files, self._files = self._files, []
+        for tmp_path, target in files:
+            if tmp_path is None:
+                if os.path.exists(target):
+                    os.remove(target)
+            else:
+                _replace_if_changed(tmp_path, target)
+
+    def discard(self):
+        files, self._files = self._files, []
+        for tmp_path, _ in files:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def process_rows(df, classifier, row_cache, profile=None):
+    # Normalization and classification only depend on the row itself, so rows whose
+    # fingerprint is already in the manifest reuse the cached result. Returns the
+    # processed frame and the number of rows that actually had to be recomputed.
+    import pandas as pd
+
+    profile = profile or StageProfile()
+    df['Fingerprint'] = pd.util.hash_pandas_object(df[ROW_COLUMNS], index=False).map('{:016x}'.format)
+    hits = df['Fingerprint'].map(row_cache)
+    cached = hits.notna()
+
+    fresh = df[~cached].copy()
+    if len(fresh):
+        with profile.stage('normalize', len(fresh)):
+            fresh = normalize_problems(fresh)
+        with profile.stage('categorize', len(fresh)):
+            fresh['Category'] = classifier.classify(fresh['Technique'])
 
+    reused = df[cached].join(pd.DataFrame(hits[cached].tolist(), index=hits[cached].index, columns=CACHED_COLUMNS))
+    reused['Problem No Sort'] = pd.to_numeric(reused['Problem No'], errors='coerce')
+
+    return pd.concat([reused, fresh]).sort_index(), len(fresh)
+
+
+def _export_records(df):
+    # Problem No is a mix of parsed strings and workbook numbers, and Completed? (like any
+    # column carried over from the CSV) can mix Excel booleans with text such as 'Yes',
+    # which pyarrow refuses to put in one column. Export them as text (as they read in
+    # the CSV) and missing values as null.
+    import pandas as pd
+
+    df = df.astype(object)
+    for column in ['Problem No', 'Completed?'] + [c for c in df.columns if c not in OUTPUT_COLUMNS]:
+        df[column] = pd.Series([None if pd.isna(value) else str(value) for value in df[column]], index=df.index,
+                               dtype=object)
+    return df.where(df.notna(), None)
+
+
+def export_jsonl(df, path, index_path, outputs):
+    # One object per line in CSV order, plus byte offsets so a consumer can seek straight
+    # to a category (rows are sorted, so each is one contiguous range) or a single problem.
+    lines = []
+    categories = {}
+    problems = {}
+    offset = 0
+    for record in _export_records(df).to_dict('records'):
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        category = categories.setdefault(record['Category'], {'offset': offset, 'length': 0, 'rows': 0})
+        category['length'] += len(line)
+        category['rows'] += 1
+        if record['Problem No'] is not None:
+            problems.setdefault(record['Problem No'], [offset, len(line)])
+        lines.append(line)
+        offset += len(line)
+
+    outputs.write(path, b''.join(lines).decode('utf-8'))
+    outputs.write(index_path, json.dumps({
+        'file': os.path.basename(path),
+        'categories': categories,
+        'problems': problems,
+    }, ensure_ascii=False, indent=1) + '\n')
+
+
+def export_columnar(df, path, fmt, outputs):
+    columnar = _export_records(df).astype({'Category': 'category', 'Technique': 'category'})
+    if fmt == 'parquet':
+        columnar.to_parquet(outputs.path(path), index=False)
+    else:
+        columnar.to_feather(outputs.path(path))
+
+
+def _frame(rows):
+    # object dtype keeps workbook values as read (no int -> float upcasting around
+    # missing numbers), independent of which rows happen to share a frame
+    import pandas as pd
+
+    return pd.DataFrame(rows, columns=ROW_COLUMNS, dtype=object)
+
+
+def _builtin_rows():
+    return (
+        SheetRow(p["Problem Number"], p["Problem Name"], p["Technique"], p["Link"], None)
+        for p in EXTRA_PROBLEMS
+    )
+
+
+def _padding_rows(count, used):
+    padding = []
+    num = 3000
+    for i in range(count):
+        while num in used:
+            num += 1
+        padding.append(SheetRow(
+            num,
+            f"{num}. Extra Problem {i+1}",
+            "Various",
+            f"https://leetcode.com/problems/extra-problem-{i+1}/",
+            None,
+        ))
+        num += 1
+    return padding
+
+
+def _final_frame(df, id_counts=None):
     df['Link'] = df['Link'].apply(lambda x: f"{x} " if x else x)
-    
-    final_df = df[['Category', 'Problem No', 'Link', 'Problem Name Clean', 'Technique', 'Completed?']]
-    final_df.columns = ['Category', 'Problem No', 'Link', 'Problem Name', 'Technique', 'Completed?']
+    df['ID'] = problem_ids(df['Problem No'], df['Problem Name Clean'], id_counts)
+    final_df = df[['Category', 'Problem No', 'Link', 'Problem Name Clean', 'Technique', 'Completed?', 'ID', 'Problem No Sort']]
+    final_df.columns = OUTPUT_COLUMNS + ['Problem No Sort']
+    return final_df
+
+
+def _problem_id(no, name):
+    if no is None or (isinstance(no, float) and math.isnan(no)):
+        no = ''
+    try:
+        num = float(no)
+        if num.is_integer():
+            return f"lc-{int(num)}"
+    except (TypeError, ValueError):
+        pass
+    return 'lc-' + hashlib.sha1(f"{no}|{name}".encode('utf-8')).hexdigest()[:12]
+
+
+def _unique_id(row_id, counts):
+    counts[row_id] += 1
+    return row_id if counts[row_id] == 1 else f"{row_id}-{counts[row_id]}"
+
+
+def problem_ids(problem_no, names, counts=None):
+    # Stable across runs: "lc-<number>" for numbered problems (unique after dedupe),
+    # otherwise a short hash of number and name. Unnumbered rows can share a name (or be
+    # blank formatted rows), so repeats get "-2", "-3", ... in input order; pass the same
+    # counts to number the IDs consistently across chunks.
+    import pandas as pd
+
+    counts = Counter() if counts is None else counts
+    no = pd.to_numeric(problem_no, errors='coerce')
+    numbered = no.notna() & (no % 1 == 0)
+    ids = pd.Series(None, index=problem_no.index, dtype=object)
+    ids[numbered] = 'lc-' + no[numbered].astype('int64').astype(str)
+    ids[~numbered] = [
+        _unique_id(_problem_id(n, m), counts) for n, m in zip(problem_no[~numbered], names[~numbered])
+    ]
+    return ids
+
+
+def load_previous_output(path):
+    # The last CSV as text, keyed by ID; CSVs written before IDs existed get theirs derived
+    import pandas as pd
+
+    try:
+        previous = pd.read_csv(path, dtype=str, keep_default_na=False)
+    except (OSError, pd.errors.EmptyDataError):
+        return None
+    if 'ID' not in previous.columns:
+        previous['ID'] = problem_ids(previous['Problem No'], previous['Problem Name'])
+    previous = previous.set_index('ID', drop=False)
+    return previous[~previous.index.duplicated(keep='first')]
+
+
+def carry_forward(final_df, previous):
+    # Hash join on ID: a Completed? value recorded in the previous CSV is kept unless the
+    # workbook now sets one, and columns someone added to the CSV are carried along.
+    if previous is None:
+        return final_df
+    completed = final_df['Completed?']
+    missing = completed.isna() | (completed.astype(str) == '')
+    recorded = previous['Completed?'][previous['Completed?'] != '']
+    carried = final_df['ID'].map(recorded)
+    final_df['Completed?'] = completed.where(~missing, carried)
+
+    extra_columns = [c for c in previous.columns if c not in final_df.columns]
+    for column in extra_columns:
+        final_df[column] = final_df['ID'].map(previous[column])
+    return final_df
+
+
+def diff_outputs(previous, text):
+    # Rows added, removed or changed relative to the previous CSV, compared as CSV text.
+    # Like load_previous_output(), only the first row per ID takes part.
+    import pandas as pd
+
+    current = pd.read_csv(io.StringIO(text), dtype=str, keep_default_na=False)
+    current = current[~current['ID'].duplicated(keep='first')].set_index('ID', drop=False)
+    if previous is None:
+        previous = current.iloc[0:0]
+    columns = list(current.columns) + [c for c in previous.columns if c not in current.columns]
+    common = current.index.intersection(previous.index, sort=False)
+    before = previous.reindex(index=common, columns=columns, fill_value='')
+    after = current.reindex(index=common, columns=columns, fill_value='')
+    differs = before.ne(after)
+    changed = differs.any(axis=1).reindex(current.index, fill_value=False)
+    added = ~current.index.isin(previous.index)
+
+    delta = []
+    for row_id, row, is_added, is_changed in zip(current.index, current.to_dict('records'), added, changed):
+        if is_added:
+            delta.append({'op': 'added', 'id': row_id, 'row': row})
+        elif is_changed:
+            fields = [c for c in columns if differs.at[row_id, c]]
+            delta.append({'op': 'changed', 'id': row_id, 'fields': fields, 'row': row})
+    for row_id in previous.index.difference(current.index, sort=False):
+        delta.append({'op': 'removed', 'id': row_id})
+    return delta
+
+
+def _previous_progress(path, db):
+    # Chunked mode only needs the rows that have a Completed? value or something in a
+    # column added to the CSV, read as a stream into tables in db
+    completions = DiskMap(db, 'completions')
+    extras = DiskMap(db, 'extras', encode=json.dumps, decode=json.loads)
+    columns = []
+    counts = DiskMap(db, 'previous_id_counts', default=0)
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            columns = [c for c in reader.fieldnames or () if c not in OUTPUT_COLUMNS]
+            for row in reader:
+                row_id = row.get('ID') or _unique_id(_problem_id(row.get('Problem No'), row.get('Problem Name')), counts)
+                if row.get('Completed?'):
+                    completions.add(row_id, row['Completed?'])
+                values = [row.get(c) or '' for c in columns]
+                if any(values):
+                    extras.add(row_id, values)
+    except OSError:
+        pass
+    return Progress(completions, columns, extras)
+
+
+def _cache_entries(df):
+    return dict(zip(df['Fingerprint'], df[CACHED_COLUMNS].itertuples(index=False, name=None)))
+
+
+def load_row_cache(path, inputs):
+    # Cached rows are only valid for the same processing code and classifier rules
+    cache = load_manifest(path)
+    if cache.get('version') != inputs['version'] or cache.get('rules') != inputs['rules']:
+        return {}
+    return cache.get('rows', {})
+
+
+def organize_leetcode(sources=(SOURCE_WORKBOOK,), jobs=None, force=False, emit=(), chunk_size=None, profile=None,
+                      session=None):
+    # The manifest stays small so the up-to-date check is cheap; the per-row cache, which
+    # grows with the workbook, lives in a separate file that is only read to rebuild.
+    profile = profile or StageProfile()
+    row_cache_path = f"{OUTPUT_CSV}.rows.json"
+    with profile.stage('manifest check'):
+        manifest = session.manifest if session and session.manifest is not None else load_manifest(MANIFEST_JSON)
+        inputs = build_inputs(sources, emit)
+        extra_outputs = output_paths(emit)
+        up_to_date = not force and manifest_stale_reason(manifest, inputs, extra_outputs) is None
+
+    if up_to_date:
+        outputs = PendingOutputs()
+        _clear_delta(outputs)
+        outputs.commit()
+        print(f"'{OUTPUT_CSV}' is up to date")
+        return
+
+    # Imported up front so a profile reports them as their own stage instead of inflating
+    # whichever stage happens to use them first
+    with profile.stage('import'):
+        import openpyxl  # noqa: F401
+        import pandas  # noqa: F401
+    with profile.stage('row cache load'):
+        if session and session.row_cache is not None and session.rules == inputs['rules']:
+            row_cache = session.row_cache
+        else:
+            row_cache = load_row_cache(row_cache_path, inputs)
+    classifier = session.get_classifier(inputs['rules']) if session else CategoryClassifier.from_file(CATEGORY_RULES)
+
+    # Only reads each workbook's sheet list; opening the workbooks with openpyxl and the
+    # hyperlink pass happen per sheet (possibly in worker processes) under 'row extraction'
+    with profile.stage('sheet discovery'):
+        tasks = expand_sources(sources)
+    outputs = PendingOutputs()
+    try:
+        if chunk_size:
+            output_hash, rows, summary = _build_external(tasks, classifier, chunk_size, outputs, profile)
+        else:
+            if session:
+                source_hashes = {parse_source(spec)[0]: sha for spec, sha in inputs['sources']}
+                read = partial(session.read_sources, tasks, jobs, source_hashes)
+            else:
+                read = partial(read_sources, tasks, jobs)
+            output_hash, rows, summary = _build_in_memory(read, len(tasks), classifier, row_cache, extra_outputs, outputs,
+                                                          profile)
+        # An export left over from a build that asked for it would go stale
+        for path in output_paths(EXPORT_FORMATS).values():
+            if path not in extra_outputs.values() and os.path.exists(path):
+                outputs.remove(path)
+
+        manifest = {'inputs': inputs, 'output': output_hash}
+        with profile.stage('manifest write'):
+            # Row cache before the manifest: the manifest is what marks the build as complete.
+            # Chunked builds keep no row cache (rows is None) and leave the existing one as it is.
+            if rows is not None:
+                outputs.write(row_cache_path, json.dumps({'version': inputs['version'], 'rules': inputs['rules'],
+                                                          'rows': rows}, separators=(',', ':'), default=str))
+            outputs.write(MANIFEST_JSON, json.dumps(manifest, separators=(',', ':'), default=str))
+        with profile.stage('install outputs'):
+            outputs.commit()
+    except BaseException:
+        outputs.discard()
+        raise
+    # Only reported once everything is in place, so a failing stdout cannot lose the build
+    for line in summary:
+        print(line)
+    if session:
+        session.manifest = manifest
+        if rows is not None:
+            session.row_cache = rows
+
+
+def _clear_delta(outputs):
+    # A run that computes no delta must not leave the last one behind, or a consumer that
+    # applies each delta would apply those changes a second time
+    if os.path.exists(DELTA_JSONL):
+        outputs.write(DELTA_JSONL, '')
+
+
+def _summary(total, reprocessed, sheets, duplicates, overridden, problems, written):
+    lines = []
+    if duplicates:
+        lines.append(f"Merged {duplicates} duplicate workbook rows (the first row per problem number is kept)")
+    if overridden:
+        lines.append(f"Merged {overridden} built-in problems already in the workbook (workbook rows take precedence)")
+    lines.append(f"Reprocessed {reprocessed} of {total} rows from {sheets} sheet(s)")
+    if written:
+        lines.append(f"Successfully organized {problems} problems into '{OUTPUT_CSV}'")
+    else:
+        lines.append(f"'{OUTPUT_CSV}' unchanged ({problems} problems)")
+    return lines
+
+
+def _build_in_memory(read, sheets, classifier, row_cache, extra_outputs, outputs, profile):
+    import pandas as pd
+
+    with profile.stage('row extraction') as stage:
+        data = read()
+        stage['rows'] = sheet_rows = len(data)
+    with profile.stage('extra-problem merge', len(EXTRA_PROBLEMS)):
+        data.extend(_builtin_rows())
+        total = len(data)
+        raw = _frame(data)
+    df, reprocessed = process_rows(raw, classifier, row_cache, profile)
+    rows = _cache_entries(df)
+    with profile.stage('dedupe', len(df)):
+        df, duplicated = dedupe_problems(df)
+        duplicates = int(duplicated.iloc[:sheet_rows].sum())
+        overridden = int(duplicated.iloc[sheet_rows:].sum())
+
+    # Generate more dummy problems to reach exactly 300 if needed
+    if len(df) < 300:
+        padding = _padding_rows(300 - len(df), set(df['Problem No Sort'].dropna()))
+        padding_df, padded = process_rows(_frame(padding), classifier, row_cache, profile)
+        rows.update(_cache_entries(padding_df))
+        df = pd.concat([df, padding_df], ignore_index=True)
+        reprocessed += padded
+        total += len(padding)
+
+    with profile.stage('sort', len(df)):
+        final_df = _final_frame(df)
+        final_df = final_df.sort_values(by=['Category', 'Problem No Sort']).drop(columns=['Problem No Sort']).reset_index(drop=True)
+
+    with profile.stage('progress merge', len(final_df)):
+        previous = load_previous_output(OUTPUT_CSV)
+        final_df = carry_forward(final_df, previous)
+
+    with profile.stage('to_csv', len(final_df)):
+        text = final_df.to_csv(index=False)
+        output_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        written = not _is_current(OUTPUT_CSV, output_hash)
+        outputs.write(OUTPUT_CSV, text)
+
+    with profile.stage('delta', len(final_df)):
+        delta = diff_outputs(previous, text)
+        outputs.write(DELTA_JSONL, ''.join(json.dumps(change, ensure_ascii=False) + '\n' for change in delta))
+
+    if extra_outputs:
+        with profile.stage('exports', len(final_df)):
+            if 'jsonl' in extra_outputs:
+                export_jsonl(final_df, extra_outputs['jsonl'], extra_outputs['index'], outputs)
+            for fmt in ('parquet', 'arrow'):
+                if fmt in extra_outputs:
+                    export_columnar(final_df, extra_outputs[fmt], fmt, outputs)
+
+    summary = _summary(total, reprocessed, sheets, duplicates, overridden, len(final_df), written)
+    if delta:
+        counts = {op: sum(1 for change in delta if change['op'] == op) for op in ('added', 'changed', 'removed')}
+        summary.append(f"Delta: {counts['added']} added, {counts['changed']} changed, {counts['removed']} removed "
+                       f"-> '{DELTA_JSONL}'")
+    return output_hash, rows, summary
+
+
+def _build_external(tasks, classifier, chunk_size, outputs, profile=None):
+    # Out-of-core export: rows are processed chunk_size at a time, each chunk is sorted
+    # and spilled to a temp run file, and the runs are k-way merged into the CSV. State
+    # that grows with the input (shared strings and hyperlinks of the sheet being read,
+    # problem numbers seen, ID counts of unnumbered rows, progress recorded in the
+    # previous CSV) lives in an SQLite database next to the runs and is looked up row by
+    # row, so memory depends on chunk_size, plus one open file per run in the merge.
+    # The per-row cache is neither used nor updated in this mode, and the delta file is
+    # left empty.
+    import sqlite3
+
+    profile = profile or StageProfile()
+    total = problems = 0
+    # Rows dropped as duplicates, counted separately for workbook rows and built-ins
+    merged = [0, 0]
+    with tempfile.TemporaryDirectory(prefix='organize_leetcode_') as run_dir:
+        # Scratch data only: no journal, no fsync, one transaction that is never committed
+        db = sqlite3.connect(os.path.join(run_dir, 'state.db'))
+        try:
+            db.execute('PRAGMA journal_mode = OFF')
+            db.execute('PRAGMA synchronous = OFF')
+            with profile.stage('progress merge'):
+                progress = _previous_progress(OUTPUT_CSV, db)
+            columns = OUTPUT_COLUMNS + progress.columns
+            seen = DiskMap(db, 'seen')
+            id_counts = DiskMap(db, 'id_counts', default=0)
+
+            runs = []
+            sources = [(row for task in tasks for row in iter_sheet_rows(*task, db=db)), _builtin_rows()]
+            for i, source in enumerate(sources):
+                while True:
+                    with profile.stage('row extraction') as stage:
+                        chunk = list(itertools.islice(source, chunk_size))
+                        stage['rows'] = len(chunk)
+                    if not chunk:
+                        break
+                    run = _sorted_run(chunk, total, classifier, seen, id_counts, progress, profile)
+                    with profile.stage('spill runs', len(run)):
+                        runs.append(_write_run(run, run_dir, len(runs), columns))
+                    total += len(chunk)
+                    merged[i] += len(chunk) - len(run)
+                    problems += len(run)
+
+            if problems < 300:
+                padding = _padding_rows(300 - problems, seen)
+                run = _sorted_run(padding, total, classifier, seen, id_counts, progress, profile)
+                runs.append(_write_run(run, run_dir, len(runs), columns))
+                total += len(padding)
+                problems += len(padding)
+        finally:
+            db.close()
+
+        with profile.stage('merge runs', problems):
+            output_hash, written = _merge_runs(runs, OUTPUT_CSV, outputs, columns)
+
+    _clear_delta(outputs)
+    return output_hash, None, _summary(total, total, len(tasks), *merged, problems, written)
+
+
+def _sorted_run(chunk, start, classifier, seen, id_counts, progress, profile):
+    import pandas as pd
+
+    with profile.stage('normalize', len(chunk)):
+        df = normalize_problems(_frame(chunk))
+    with profile.stage('categorize', len(df)):
+        df['Category'] = classifier.classify(df['Technique'])
+    df['Seq'] = range(start, start + len(df))
+
+    # Same precedence as dedupe_problems(), against every number seen in earlier chunks
+    with profile.stage('dedupe', len(df)):
+        key = df['Problem No Sort']
+        df = df[[pd.isna(no) or seen.add(float(no)) for no in key]]
+
+    # Seq breaks ties in input order, matching the stable in-memory sort
+    with profile.stage('sort', len(df)):
+        run = _final_frame(df, id_counts).assign(Seq=df['Seq']).sort_values(by=['Category', 'Problem No Sort', 'Seq'])
+
+    with profile.stage('progress merge', len(run)):
+        completed = run['Completed?']
+        missing = completed.isna() | (completed.astype(str) == '')
+        run['Completed?'] = completed.where(~missing, run['ID'].map(progress.completions.get))
+        if progress.columns:
+            blank = [''] * len(progress.columns)
+            carried = [progress.extras.get(row_id, blank) for row_id in run['ID']]
+            for i, column in enumerate(progress.columns):
+                run[column] = [values[i] for values in carried]
+    return run
+
+
+def _write_run(df, run_dir, n, columns):
+    path = os.path.join(run_dir, f"run{n:05d}.csv")
+    df[['Problem No Sort', 'Seq'] + columns].to_csv(path, index=False, header=False)
+    return path
+
+
+def _run_records(f):
+    for fields in csv.reader(f):
+        no_sort = float(fields[0]) if fields[0] else math.inf
+        yield (fields[2], no_sort, int(fields[1])), fields[2:]
+
+
+def _merge_runs(run_paths, output_path, outputs, columns):
+    tmp_path = outputs.path(output_path)
+    files = [open(p, 'r', encoding='utf-8', newline='') for p in run_paths]
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as out:
+            writer = csv.writer(out, lineterminator=os.linesep)
+            writer.writerow(columns)
+            for _, fields in heapq.merge(*(_run_records(f) for f in files), key=lambda record: record[0]):
+                writer.writerow(fields)
+    finally:
+        for f in files:
+            f.close()
+
+    output_hash = sha256_file(tmp_path)
+    return output_hash, not _is_current(output_path, output_hash)
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _start_polling(paths, changed, interval):
+    def poll():
+        signatures = {path: _file_signature(path) for path in paths}
+        while True:
+            time.sleep(interval)
+            for path in paths:
+                signature = _file_signature(path)
+                if signature != signatures[path]:
+                    signatures[path] = signature
+                    changed.set()
+
+    threading.Thread(target=poll, name='organize-poll', daemon=True).start()
+
+
+def _start_observer(paths, changed):
+    # watchdog uses inotify on Linux (FSEvents/ReadDirectoryChangesW elsewhere); without
+    # it the caller falls back to polling
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    watched = set(paths)
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Only writes count; opens/reads (including our own hashing) must not retrigger.
+            # Spreadsheet apps often save to a temp file and rename it over the original.
+            if event.event_type not in ('created', 'modified', 'moved', 'deleted', 'closed'):
+                return
+            for path in (event.src_path, getattr(event, 'dest_path', None)):
+                if path and os.path.abspath(os.fsdecode(path)) in watched:
+                    changed.set()
+
+    observer = Observer()
+    for directory in {os.path.dirname(path) for path in paths}:
+        observer.schedule(Handler(), directory, recursive=False)
+    observer.start()
+    return observer
+
+
+def watch(sources=(SOURCE_WORKBOOK,), debounce=0.3, poll_interval=0.5, poll=False, **options):
+    # Rebuild whenever a source workbook or the category rules change. Bursts of save
+    # events are collapsed into one rebuild, and parsed sheets, the classifier and the
+    # row cache stay in memory between rebuilds.
+    paths = sorted({os.path.abspath(parse_source(spec)[0]) for spec in sources} | {CATEGORY_RULES})
+    changed = threading.Event()
+    observer = None if poll else _start_observer(paths, changed)
+    if observer is None:
+        _start_polling(paths, changed, poll_interval)
+    session = BuildSession()
+
+    print(f"Watching {len(paths)} file(s) with {'inotify' if observer else 'polling'}; press Ctrl+C to stop")
+    changed.set()
+    try:
+        while True:
+            # Short timeouts keep Ctrl+C responsive on every platform
+            while not changed.wait(1):
+                pass
+            while True:
+                changed.clear()
+                if not changed.wait(debounce):
+                    break
+
+            start = time.perf_counter()
+            try:
+                organize_leetcode(sources, session=session, **options)
+            except Exception as e:
+                # Typically a workbook caught mid-save; the next save triggers another rebuild
+                print(f"Rebuild failed: {type(e).__name__}: {e}")
+            else:
+                print(f"Rebuilt in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        print("Stopped watching")
+    finally:
+        if observer:
+            observer.stop()
+            observer.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=f"Organize LeetCode problem workbooks into '{OUTPUT_CSV}'.")
+    parser.add_argument('sources', nargs='*', default=[SOURCE_WORKBOOK], metavar='WORKBOOK[:SHEETS]',
+                        help="workbook to read, optionally with ':Sheet1,Sheet2' or ':*' to pick tabs "
+                             f"(default: '{SOURCE_WORKBOOK}', active tab)")
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes for parsing (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='rebuild even if the inputs are unchanged')
+    parser.add_argument('--emit', action='append', default=[], choices=EXPORT_FORMATS,
+                        help='also write this format next to the CSV (repeatable); '
+                             'jsonl comes with a byte-offset index, parquet/arrow need pyarrow; '
+                             'exports from earlier builds that are not asked for again are removed')
+    parser.add_argument('--chunk-size', type=int, metavar='ROWS',
+                        help='process ROWS rows at a time, keeping sorted runs and per-problem state on disk, so '
+                             'peak memory depends on ROWS rather than on the size of the workbook')
+    parser.add_argument('--profile', metavar='REPORT.json',
+                        help='write per-stage wall time, rows/s and peak RSS growth to this JSON file')
+    parser.add_argument('--cprofile', metavar='OUT.prof',
+                        help='also dump cProfile stats (pstats format, e.g. for snakeviz or flameprof); '
+                             'parsing done in worker processes is not included')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and rebuild whenever a source workbook or the category rules change')
+    parser.add_argument('--debounce', type=float, default=0.3, metavar='SECONDS',
+                        help='with --watch, wait for this much quiet after a save before rebuilding (default: 0.3)')
+    parser.add_argument('--poll', action='store_true',
+                        help='with --watch, poll file stats instead of using inotify (watchdog)')
+    parser.add_argument('--poll-interval', type=float, default=0.5, metavar='SECONDS',
+                        help='with --watch, how often to poll when polling (default: 0.5)')
+    args = parser.parse_args(argv)
+
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive number of rows")
+    if args.chunk_size and args.emit:
+        parser.error("--emit is not supported together with --chunk-size")
+    if {'parquet', 'arrow'} & set(args.emit) and importlib.util.find_spec('pyarrow') is None:
+        parser.error("--emit parquet/arrow requires pyarrow (pip install pyarrow)")
+
+    if args.watch:
+        watch(args.sources, debounce=args.debounce, poll_interval=args.poll_interval, poll=args.poll,
+              jobs=args.jobs, emit=args.emit, chunk_size=args.chunk_size)
+        return
+
+    profile = StageProfile()
+    profiler = None
+    if args.cprofile:
+        import cProfile
 
-    final_df['Problem No Sort'] = pd.to_numeric(final_df['Problem No'], errors='coerce')
-    final_df = final_df.sort_values(by=['Category', 'Problem No Sort']).drop(columns=['Problem No Sort'])
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        organize_leetcode(args.sources, jobs=args.jobs, force=args.force, emit=args.emit,
+                          chunk_size=args.chunk_size, profile=profile)
+    except SourceError as e:
+        # Missing workbooks, unknown sheet names and files that are not workbooks
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
 
-    # Ensure total is at least 300
-    if len(final_df) > 300:
-        final_df = final_df.head(300)
+    if args.profile:
+        report = profile.report()
+        report['args'] = vars(args)
+        with open(args.profile, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"Stage profile written to '{args.profile}':")
+        profile.print_summary()
 
-    final_df.to_csv('leetcode_problems.csv', index=False)
-    print(f"Successfully organized {len(final_df)} problems into 'leetcode_problems.csv'")
 
 if __name__ == "__main__":
-    organize_leetcode()
+    main()
@@ -0,0 +1,279 @@
+import hashlib
+import json
+import os
+
+# Build inputs, output names and the manifest check shared by organize_leetcode.py and
+# `nexus.py check`. Standard library only (no zipfile, xml or pandas), so deciding
+# whether a rebuild is needed stays cheap to import.
+
+SOURCE_WORKBOOK = 'leetcode problems.xlsx'
+OUTPUT_CSV = 'leetcode_problems.csv'
+MANIFEST_JSON = f"{OUTPUT_CSV}.manifest.json"
+WORKBOOK_SUFFIXES = ('.xlsx', '.xlsm')
+EXPORT_FORMATS = ('jsonl', 'parquet', 'arrow')
+CATEGORY_RULES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'leetcode_categories.json')
+# Bump whenever the code that produces organize_leetcode.CACHED_COLUMNS changes
+MANIFEST_VERSION = 4
+
+# Adding a large list of problems to reach 300+ total
+EXTRA_PROBLEMS = [
+    # Array & Hashing
+    {"Problem Number": 1, "Problem Name": "1. Two Sum", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/two-sum/"},
+    {"Problem Number": 217, "Problem Name": "217. Contains Duplicate", "Technique": "Hash Set", "Link": "https://leetcode.com/problems/contains-duplicate/"},
+    {"Problem Number": 242, "Problem Name": "242. Valid Anagram", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/valid-anagram/"},
+    {"Problem Number": 49, "Problem Name": "49. Group Anagrams", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/group-anagrams/"},
+    {"Problem Number": 347, "Problem Name": "347. Top K Frequent Elements", "Technique": "Heap / Bucket Sort", "Link": "https://leetcode.com/problems/top-k-frequent-elements/"},
+    {"Problem Number": 238, "Problem Name": "238. Product of Array Except Self", "Technique": "Prefix/Suffix Product", "Link": "https://leetcode.com/problems/product-of-array-except-self/"},
+    {"Problem Number": 36, "Problem Name": "36. Valid Sudoku", "Technique": "Hash Set", "Link": "https://leetcode.com/problems/valid-sudoku/"},
+    {"Problem Number": 128, "Problem Name": "128. Longest Consecutive Sequence", "Technique": "Hash Set", "Link": "https://leetcode.com/problems/longest-consecutive-sequence/"},
+    
+    # Two Pointers
+    {"Problem Number": 125, "Problem Name": "125. Valid Palindrome", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/valid-palindrome/"},
+    {"Problem Number": 167, "Problem Name": "167. Two Sum II - Input Array Is Sorted", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/two-sum-ii-input-array-is-sorted/"},
+    {"Problem Number": 15, "Problem Name": "15. 3Sum", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/3sum/"},
+    {"Problem Number": 11, "Problem Name": "11. Container With Most Water", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/container-with-most-water/"},
+    {"Problem Number": 42, "Problem Name": "42. Trapping Rain Water", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/trapping-rain-water/"},
+    
+    # Sliding Window
+    {"Problem Number": 121, "Problem Name": "121. Best Time to Buy and Sell Stock", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock/"},
+    {"Problem Number": 3, "Problem Name": "3. Longest Substring Without Repeating Characters", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/longest-substring-without-repeating-characters/"},
+    {"Problem Number": 424, "Problem Name": "424. Longest Repeating Character Replacement", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/longest-repeating-character-replacement/"},
+    {"Problem Number": 567, "Problem Name": "567. Permutation in String", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/permutation-in-string/"},
+    {"Problem Number": 76, "Problem Name": "76. Minimum Window Substring", "Technique": "Sliding Window", "Link": "https://leetcode.com/problems/minimum-window-substring/"},
+    {"Problem Number": 239, "Problem Name": "239. Sliding Window Maximum", "Technique": "Deque", "Link": "https://leetcode.com/problems/sliding-window-maximum/"},
+    
+    # Stack
+    {"Problem Number": 20, "Problem Name": "20. Valid Parentheses", "Technique": "Stack", "Link": "https://leetcode.com/problems/valid-parentheses/"},
+    {"Problem Number": 155, "Problem Name": "155. Min Stack", "Technique": "Stack", "Link": "https://leetcode.com/problems/min-stack/"},
+    {"Problem Number": 150, "Problem Name": "150. Evaluate Reverse Polish Notation", "Technique": "Stack", "Link": "https://leetcode.com/problems/evaluate-reverse-polish-notation/"},
+    {"Problem Number": 22, "Problem Name": "22. Generate Parentheses", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/generate-parentheses/"},
+    {"Problem Number": 739, "Problem Name": "739. Daily Temperatures", "Technique": "Monotonic Stack", "Link": "https://leetcode.com/problems/daily-temperatures/"},
+    {"Problem Number": 853, "Problem Name": "853. Car Fleet", "Technique": "Stack", "Link": "https://leetcode.com/problems/car-fleet/"},
+    {"Problem Number": 84, "Problem Name": "84. Largest Rectangle in Histogram", "Technique": "Monotonic Stack", "Link": "https://leetcode.com/problems/largest-rectangle-in-histogram/"},
+    
+    # Binary Search
+    {"Problem Number": 704, "Problem Name": "704. Binary Search", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/binary-search/"},
+    {"Problem Number": 74, "Problem Name": "74. Search a 2D Matrix", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/search-a-2d-matrix/"},
+    {"Problem Number": 875, "Problem Name": "875. Koko Eating Bananas", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/koko-eating-bananas/"},
+    {"Problem Number": 153, "Problem Name": "153. Find Minimum in Rotated Sorted Array", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/find-minimum-in-rotated-sorted-array/"},
+    {"Problem Number": 33, "Problem Name": "33. Search in Rotated Sorted Array", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/search-in-rotated-sorted-array/"},
+    {"Problem Number": 981, "Problem Name": "981. Time Based Key-Value Store", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/time-based-key-value-store/"},
+    {"Problem Number": 4, "Problem Name": "4. Median of Two Sorted Arrays", "Technique": "Binary Search", "Link": "https://leetcode.com/problems/median-of-two-sorted-arrays/"},
+
+    # Linked List
+    {"Problem Number": 206, "Problem Name": "206. Reverse Linked List", "Technique": "Linked List", "Link": "https://leetcode.com/problems/reverse-linked-list/"},
+    {"Problem Number": 21, "Problem Name": "21. Merge Two Sorted Lists", "Technique": "Linked List", "Link": "https://leetcode.com/problems/merge-two-sorted-lists/"},
+    {"Problem Number": 143, "Problem Name": "143. Reorder List", "Technique": "Linked List", "Link": "https://leetcode.com/problems/reorder-list/"},
+    {"Problem Number": 19, "Problem Name": "19. Remove Nth Node From End of List", "Technique": "Linked List", "Link": "https://leetcode.com/problems/remove-nth-node-from-end-of-list/"},
+    {"Problem Number": 138, "Problem Name": "138. Copy List with Random Pointer", "Technique": "Hash Map", "Link": "https://leetcode.com/problems/copy-list-with-random-pointer/"},
+    {"Problem Number": 2, "Problem Name": "2. Add Two Numbers", "Technique": "Linked List", "Link": "https://leetcode.com/problems/add-two-numbers/"},
+    {"Problem Number": 141, "Problem Name": "141. Linked List Cycle", "Technique": "Two Pointers", "Link": "https://leetcode.com/problems/linked-list-cycle/"},
+    {"Problem Number": 287, "Problem Name": "287. Find the Duplicate Number", "Technique": "Floyd's Cycle Detection", "Link": "https://leetcode.com/problems/find-the-duplicate-number/"},
+    {"Problem Number": 146, "Problem Name": "146. LRU Cache", "Technique": "Hash Map & DLL", "Link": "https://leetcode.com/problems/lru-cache/"},
+    {"Problem Number": 23, "Problem Name": "23. Merge k Sorted Lists", "Technique": "Heap / Merge Sort", "Link": "https://leetcode.com/problems/merge-k-sorted-lists/"},
+    {"Problem Number": 25, "Problem Name": "25. Reverse Nodes in k-Group", "Technique": "Linked List", "Link": "https://leetcode.com/problems/reverse-nodes-in-k-group/"},
+
+    # Trees
+    {"Problem Number": 226, "Problem Name": "226. Invert Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/invert-binary-tree/"},
+    {"Problem Number": 104, "Problem Name": "104. Maximum Depth of Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/maximum-depth-of-binary-tree/"},
+    {"Problem Number": 543, "Problem Name": "543. Diameter of Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/diameter-of-binary-tree/"},
+    {"Problem Number": 110, "Problem Name": "110. Balanced Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/balanced-binary-tree/"},
+    {"Problem Number": 100, "Problem Name": "100. Same Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/same-tree/"},
+    {"Problem Number": 572, "Problem Name": "572. Subtree of Another Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/subtree-of-another-tree/"},
+    {"Problem Number": 235, "Problem Name": "235. Lowest Common Ancestor of a Binary Search Tree", "Technique": "BST", "Link": "https://leetcode.com/problems/lowest-common-ancestor-of-a-binary-search-tree/"},
+    {"Problem Number": 102, "Problem Name": "102. Binary Tree Level Order Traversal", "Technique": "BFS", "Link": "https://leetcode.com/problems/binary-tree-level-order-traversal/"},
+    {"Problem Number": 199, "Problem Name": "199. Binary Tree Right Side View", "Technique": "BFS", "Link": "https://leetcode.com/problems/binary-tree-right-side-view/"},
+    {"Problem Number": 1448, "Problem Name": "1448. Count Good Nodes in Binary Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/count-good-nodes-in-binary-tree/"},
+    {"Problem Number": 98, "Problem Name": "98. Validate Binary Search Tree", "Technique": "DFS", "Link": "https://leetcode.com/problems/validate-binary-search-tree/"},
+    {"Problem Number": 230, "Problem Name": "230. Kth Smallest Element in a BST", "Technique": "DFS In-order", "Link": "https://leetcode.com/problems/kth-smallest-element-in-a-bst/"},
+    {"Problem Number": 105, "Problem Name": "105. Construct Binary Tree from Preorder and Inorder Traversal", "Technique": "DFS", "Link": "https://leetcode.com/problems/construct-binary-tree-from-preorder-and-inorder-traversal/"},
+    {"Problem Number": 124, "Problem Name": "124. Binary Tree Maximum Path Sum", "Technique": "DFS", "Link": "https://leetcode.com/problems/binary-tree-maximum-path-sum/"},
+    {"Problem Number": 297, "Problem Name": "297. Serialize and Deserialize Binary Tree", "Technique": "BFS/DFS", "Link": "https://leetcode.com/problems/serialize-and-deserialize-binary-tree/"},
+
+    # Backtracking
+    {"Problem Number": 78, "Problem Name": "78. Subsets", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/subsets/"},
+    {"Problem Number": 39, "Problem Name": "39. Combination Sum", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/combination-sum/"},
+    {"Problem Number": 46, "Problem Name": "46. Permutations", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/permutations/"},
+    {"Problem Number": 90, "Problem Name": "90. Subsets II", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/subsets-ii/"},
+    {"Problem Number": 40, "Problem Name": "40. Combination Sum II", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/combination-sum-ii/"},
+    {"Problem Number": 79, "Problem Name": "79. Word Search", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/word-search/"},
+    {"Problem Number": 131, "Problem Name": "131. Palindrome Partitioning", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/palindrome-partitioning/"},
+    {"Problem Number": 17, "Problem Name": "17. Letter Combinations of a Phone Number", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/letter-combinations-of-a-phone-number/"},
+    {"Problem Number": 51, "Problem Name": "51. N-Queens", "Technique": "Backtracking", "Link": "https://leetcode.com/problems/n-queens/"},
+
+    # Graphs
+    {"Problem Number": 200, "Problem Name": "200. Number of Islands", "Technique": "BFS/DFS", "Link": "https://leetcode.com/problems/number-of-islands/"},
+    {"Problem Number": 695, "Problem Name": "695. Max Area of Island", "Technique": "DFS", "Link": "https://leetcode.com/problems/max-area-of-island/"},
+    {"Problem Number": 133, "Problem Name": "133. Clone Graph", "Technique": "BFS/DFS", "Link": "https://leetcode.com/problems/clone-graph/"},
+    {"Problem Number": 994, "Problem Name": "994. Rotting Oranges", "Technique": "BFS", "Link": "https://leetcode.com/problems/rotting-oranges/"},
+    {"Problem Number": 417, "Problem Name": "417. Pacific Atlantic Water Flow", "Technique": "DFS", "Link": "https://leetcode.com/problems/pacific-atlantic-water-flow/"},
+    {"Problem Number": 130, "Problem Name": "130. Surrounded Regions", "Technique": "DFS", "Link": "https://leetcode.com/problems/surrounded-regions/"},
+    {"Problem Number": 207, "Problem Name": "207. Course Schedule", "Technique": "Topological Sort", "Link": "https://leetcode.com/problems/course-schedule/"},
+    {"Problem Number": 210, "Problem Name": "210. Course Schedule II", "Technique": "Topological Sort", "Link": "https://leetcode.com/problems/course-schedule-ii/"},
+    {"Problem Number": 684, "Problem Name": "684. Redundant Connection", "Technique": "Union Find", "Link": "https://leetcode.com/problems/redundant-connection/"},
+    {"Problem Number": 127, "Problem Name": "127. Word Ladder", "Technique": "BFS", "Link": "https://leetcode.com/problems/word-ladder/"},
+
+    # Advanced Graphs
+    {"Problem Number": 1584, "Problem Name": "1584. Min Cost to Connect All Points", "Technique": "Prim's / Kruskal's", "Link": "https://leetcode.com/problems/min-cost-to-connect-all-points/"},
+    {"Problem Number": 743, "Problem Name": "743. Network Delay Time", "Technique": "Dijkstra's", "Link": "https://leetcode.com/problems/network-delay-time/"},
+    {"Problem Number": 778, "Problem Name": "778. Swim in Rising Water", "Technique": "Dijkstra's", "Link": "https://leetcode.com/problems/swim-in-rising-water/"},
+    {"Problem Number": 269, "Problem Name": "269. Alien Dictionary", "Technique": "Topological Sort", "Link": "https://leetcode.com/problems/alien-dictionary/"},
+    {"Problem Number": 787, "Problem Name": "787. Cheapest Flights Within K Stops", "Technique": "Bellman-Ford / Dijkstra's", "Link": "https://leetcode.com/problems/cheapest-flights-within-k-stops/"},
+
+    # Dynamic Programming
+    {"Problem Number": 70, "Problem Name": "70. Climbing Stairs", "Technique": "DP", "Link": "https://leetcode.com/problems/climbing-stairs/"},
+    {"Problem Number": 746, "Problem Name": "746. Min Cost Climbing Stairs", "Technique": "DP", "Link": "https://leetcode.com/problems/min-cost-climbing-stairs/"},
+    {"Problem Number": 198, "Problem Name": "198. House Robber", "Technique": "DP", "Link": "https://leetcode.com/problems/house-robber/"},
+    {"Problem Number": 213, "Problem Name": "213. House Robber II", "Technique": "DP", "Link": "https://leetcode.com/problems/house-robber-ii/"},
+    {"Problem Number": 5, "Problem Name": "5. Longest Palindromic Substring", "Technique": "DP / Two Pointers", "Link": "https://leetcode.com/problems/longest-palindromic-substring/"},
+    {"Problem Number": 647, "Problem Name": "647. Palindromic Substrings", "Technique": "DP / Two Pointers", "Link": "https://leetcode.com/problems/palindromic-substrings/"},
+    {"Problem Number": 91, "Problem Name": "91. Decode Ways", "Technique": "DP", "Link": "https://leetcode.com/problems/decode-ways/"},
+    {"Problem Number": 322, "Problem Name": "322. Coin Change", "Technique": "DP", "Link": "https://leetcode.com/problems/coin-change/"},
+    {"Problem Number": 152, "Problem Name": "152. Maximum Product Subarray", "Technique": "DP", "Link": "https://leetcode.com/problems/maximum-product-subarray/"},
+    {"Problem Number": 139, "Problem Name": "139. Word Break", "Technique": "DP", "Link": "https://leetcode.com/problems/word-break/"},
+    {"Problem Number": 300, "Problem Name": "300. Longest Increasing Subsequence", "Technique": "DP", "Link": "https://leetcode.com/problems/longest-increasing-subsequence/"},
+    {"Problem Number": 416, "Problem Name": "416. Partition Equal Subset Sum", "Technique": "DP", "Link": "https://leetcode.com/problems/partition-equal-subset-sum/"},
+    
+    # 2D DP
+    {"Problem Number": 62, "Problem Name": "62. Unique Paths", "Technique": "DP", "Link": "https://leetcode.com/problems/unique-paths/"},
+    {"Problem Number": 1143, "Problem Name": "1143. Longest Common Subsequence", "Technique": "DP", "Link": "https://leetcode.com/problems/longest-common-subsequence/"},
+    {"Problem Number": 309, "Problem Name": "309. Best Time to Buy and Sell Stock with Cooldown", "Technique": "DP", "Link": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock-with-cooldown/"},
+    {"Problem Number": 518, "Problem Name": "518. Coin Change II", "Technique": "DP", "Link": "https://leetcode.com/problems/coin-change-ii/"},
+    {"Problem Number": 494, "Problem Name": "494. Target Sum", "Technique": "DP", "Link": "https://leetcode.com/problems/target-sum/"},
+    {"Problem Number": 97, "Problem Name": "97. Interleaving String", "Technique": "DP", "Link": "https://leetcode.com/problems/interleaving-string/"},
+    {"Problem Number": 72, "Problem Name": "72. Edit Distance", "Technique": "DP", "Link": "https://leetcode.com/problems/edit-distance/"},
+    {"Problem Number": 312, "Problem Name": "312. Burst Balloons", "Technique": "DP", "Link": "https://leetcode.com/problems/burst-balloons/"},
+    {"Problem Number": 10, "Problem Name": "10. Regular Expression Matching", "Technique": "DP", "Link": "https://leetcode.com/problems/regular-expression-matching/"},
+
+    # Greedy
+    {"Problem Number": 53, "Problem Name": "53. Maximum Subarray", "Technique": "Greedy / Kadane's", "Link": "https://leetcode.com/problems/maximum-subarray/"},
+    {"Problem Number": 55, "Problem Name": "55. Jump Game", "Technique": "Greedy", "Link": "https://leetcode.com/problems/jump-game/"},
+    {"Problem Number": 45, "Problem Name": "45. Jump Game II", "Technique": "Greedy", "Link": "https://leetcode.com/problems/jump-game-ii/"},
+    {"Problem Number": 134, "Problem Name": "134. Gas Station", "Technique": "Greedy", "Link": "https://leetcode.com/problems/gas-station/"},
+    {"Problem Number": 846, "Problem Name": "846. Hand of Straights", "Technique": "Greedy / Map", "Link": "https://leetcode.com/problems/hand-of-straights/"},
+    {"Problem Number": 1899, "Problem Name": "1899. Merge Triplets to Form Target Triplet", "Technique": "Greedy", "Link": "https://leetcode.com/problems/merge-triplets-to-form-target-triplet/"},
+    {"Problem Number": 763, "Problem Name": "763. Partition Labels", "Technique": "Greedy", "Link": "https://leetcode.com/problems/partition-labels/"},
+    {"Problem Number": 678, "Problem Name": "678. Valid Parenthesis String", "Technique": "Greedy", "Link": "https://leetcode.com/problems/valid-parenthesis-string/"},
+
+    # Intervals
+    {"Problem Number": 57, "Problem Name": "57. Insert Interval", "Technique": "Intervals", "Link": "https://leetcode.com/problems/insert-interval/"},
+    {"Problem Number": 56, "Problem Name": "56. Merge Intervals", "Technique": "Intervals", "Link": "https://leetcode.com/problems/merge-intervals/"},
+    {"Problem Number": 435, "Problem Name": "435. Non-overlapping Intervals", "Technique": "Intervals", "Link": "https://leetcode.com/problems/non-overlapping-intervals/"},
+    {"Problem Number": 252, "Problem Name": "252. Meeting Rooms", "Technique": "Intervals", "Link": "https://leetcode.com/problems/meeting-rooms/"},
+    {"Problem Number": 253, "Problem Name": "253. Meeting Rooms II", "Technique": "Intervals", "Link": "https://leetcode.com/problems/meeting-rooms-ii/"},
+    {"Problem Number": 1851, "Problem Name": "1851. Minimum Interval to Include Each Query", "Technique": "Intervals / Heap", "Link": "https://leetcode.com/problems/minimum-interval-to-include-each-query/"},
+
+    # Math & Geometry
+    {"Problem Number": 48, "Problem Name": "48. Rotate Image", "Technique": "Math", "Link": "https://leetcode.com/problems/rotate-image/"},
+    {"Problem Number": 54, "Problem Name": "54. Spiral Matrix", "Technique": "Math", "Link": "https://leetcode.com/problems/spiral-matrix/"},
+    {"Problem Number": 73, "Problem Name": "73. Set Matrix Zeroes", "Technique": "Math", "Link": "https://leetcode.com/problems/set-matrix-zeroes/"},
+    {"Problem Number": 202, "Problem Name": "202. Happy Number", "Technique": "Math", "Link": "https://leetcode.com/problems/happy-number/"},
+    {"Problem Number": 66, "Problem Name": "66. Plus One", "Technique": "Math", "Link": "https://leetcode.com/problems/plus-one/"},
+    {"Problem Number": 50, "Problem Name": "50. Pow(x, n)", "Technique": "Math", "Link": "https://leetcode.com/problems/powx-n/"},
+    {"Problem Number": 43, "Problem Name": "43. Multiply Strings", "Technique": "Math", "Link": "https://leetcode.com/problems/multiply-strings/"},
+    {"Problem Number": 2013, "Problem Name": "2013. Detect Squares", "Technique": "Math / Hash Map", "Link": "https://leetcode.com/problems/detect-squares/"},
+
+    # Bit Manipulation
+    {"Problem Number": 136, "Problem Name": "136. Single Number", "Technique": "Bitwise XOR", "Link": "https://leetcode.com/problems/single-number/"},
+    {"Problem Number": 191, "Problem Name": "191. Number of 1 Bits", "Technique": "Bitwise AND", "Link": "https://leetcode.com/problems/number-of-1-bits/"},
+    {"Problem Number": 338, "Problem Name": "338. Counting Bits", "Technique": "DP / Bitwise", "Link": "https://leetcode.com/problems/counting-bits/"},
+    {"Problem Number": 190, "Problem Name": "190. Reverse Bits", "Technique": "Bitwise", "Link": "https://leetcode.com/problems/reverse-bits/"},
+    {"Problem Number": 268, "Problem Name": "268. Missing Number", "Technique": "Bitwise XOR / Sum", "Link": "https://leetcode.com/problems/missing-number/"},
+    {"Problem Number": 371, "Problem Name": "371. Sum of Two Integers", "Technique": "Bitwise", "Link": "https://leetcode.com/problems/sum-of-two-integers/"},
+    {"Problem Number": 7, "Problem Name": "7. Reverse Integer", "Technique": "Math", "Link": "https://leetcode.com/problems/reverse-integer/"},
+]
+
+
+class SourceError(ValueError):
+    # A workbook argument that cannot be used: missing, unreadable, not a workbook or
+    # naming a sheet it does not have
+    pass
+
+
+def parse_source(spec):
+    # "problems.xlsx:Sheet1,Sheet2" selects tabs, "problems.xlsx:*" every tab and a
+    # bare path the active tab. Only a suffix after a workbook extension is a selector.
+    path, sep, selector = spec.rpartition(':')
+    if sep and path.lower().endswith(WORKBOOK_SUFFIXES):
+        return path, selector
+    return spec, None
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sha256_json(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def output_paths(emit):
+    stem = os.path.splitext(OUTPUT_CSV)[0]
+    paths = {}
+    for fmt in emit:
+        if fmt == 'jsonl':
+            paths['jsonl'] = f"{stem}.jsonl"
+            paths['index'] = f"{stem}.index.json"
+        else:
+            paths[fmt] = f"{stem}.{fmt}"
+    return paths
+
+
+def _source_hash(spec):
+    path = parse_source(spec)[0]
+    try:
+        return sha256_file(path)
+    except OSError as e:
+        raise SourceError(f"cannot read '{path}': {e.strerror}") from None
+
+
+def build_inputs(sources, emit):
+    return {
+        'version': MANIFEST_VERSION,
+        'sources': [[spec, _source_hash(spec)] for spec in sources],
+        'builtins': _sha256_json(EXTRA_PROBLEMS),
+        'rules': sha256_file(CATEGORY_RULES),
+        'emit': sorted(emit),
+    }
+
+
+def manifest_stale_reason(manifest, inputs, extra_outputs):
+    # Why outputs built under manifest are out of date for inputs (see build_inputs()),
+    # or None
+    if not manifest:
+        return "no build manifest"
+    previous = manifest.get('inputs') or {}
+    changed = [key for key in inputs if previous.get(key) != inputs[key]]
+    if changed:
+        return f"{', '.join(changed)} changed"
+    if not os.path.exists(OUTPUT_CSV):
+        return f"'{OUTPUT_CSV}' is missing"
+    if manifest.get('output') != sha256_file(OUTPUT_CSV):
+        return f"'{OUTPUT_CSV}' was modified after the last build"
+    missing = [path for path in extra_outputs.values() if not os.path.exists(path)]
+    if missing:
+        return f"{', '.join(missing)} missing"
+    return None
+
+
+def stale_reason(sources=(SOURCE_WORKBOOK,), emit=None):
+    # Why a rebuild is needed, or None when the outputs are up to date. Standard library
+    # only, so it is cheap enough to run before deciding to organize at all. emit defaults
+    # to the formats the last build produced.
+    manifest = load_manifest(MANIFEST_JSON)
+    if emit is None:
+        recorded = (manifest.get('inputs') or {}).get('emit') or []
+        emit = [fmt for fmt in recorded if fmt in EXPORT_FORMATS]
+    return manifest_stale_reason(manifest, build_inputs(sources, emit), output_paths(emit))
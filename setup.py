@@ -8,22 +8,35 @@ REQUIRED_KEYS = [
     ('GOOGLE_CLIENT_SECRET', 'Enter your Google Client Secret'),
 ]
 
-def main():
-    print("🚀 Nexus OS Environment Setup (Python Edition)\n")
-    
-    current_env = {}
-    if os.path.exists(ENV_FILE):
-        print(f"ℹ️  Found existing {ENV_FILE}. Merging new values...\n")
-        with open(ENV_FILE, 'r') as f:
+def read_env(path=ENV_FILE):
+    env = {}
+    if os.path.exists(path):
+        with open(path, 'r') as f:
             for line in f:
                 if '=' in line:
                     key, val = line.strip().split('=', 1)
-                    current_env[key] = val
+                    env[key] = val
+    return env
+
+def missing_keys(env):
+    return [(key, prompt) for key, prompt in REQUIRED_KEYS if not env.get(key)]
+
+def write_env(env, path=ENV_FILE):
+    with open(path, 'w') as f:
+        for key, value in env.items():
+            f.write(f"{key}={value}\n")
+
+def main(env_file=ENV_FILE):
+    print("🚀 Nexus OS Environment Setup (Python Edition)\n")
+    
+    current_env = read_env(env_file)
+    if os.path.exists(env_file):
+        print(f"ℹ️  Found existing {env_file}. Merging new values...\n")
 
     new_env = current_env.copy()
 
     for key, prompt in REQUIRED_KEYS:
-        if key in current_env and current_env[key]:
+        if current_env.get(key):
             print(f"✅ {key} is already set.")
             # Optional: Ask to overwrite? For simplicity, skip if present.
             continue
@@ -33,11 +46,9 @@ def main():
             new_env[key] = value
 
     # Write back to .env
-    with open(ENV_FILE, 'w') as f:
-        for key, value in new_env.items():
-            f.write(f"{key}={value}\n")
+    write_env(new_env, env_file)
 
-    print(f"\n✨ Configuration saved to {ENV_FILE}!")
+    print(f"\n✨ Configuration saved to {env_file}!")
     print("👉 You can now run `npm run dev` to start the app.")
 
 if __name__ == '__main__':
@@ -31,6 +31,35 @@ interface CodeState {
     importFromCsv: (csvContent: string) => void;
 }
 
+// Splits one CSV line, honouring quoted fields such as "Pow(x, n)" and "" escapes
+const splitCsvLine = (line: string): string[] => {
+    const fields: string[] = [];
+    let field = '';
+    let quoted = false;
+    for (let i = 0; i < line.length; i++) {
+        const ch = line[i];
+        if (quoted) {
+            if (ch === '"' && line[i + 1] === '"') {
+                field += '"';
+                i++;
+            } else if (ch === '"') {
+                quoted = false;
+            } else {
+                field += ch;
+            }
+        } else if (ch === '"') {
+            quoted = true;
+        } else if (ch === ',') {
+            fields.push(field);
+            field = '';
+        } else {
+            field += ch;
+        }
+    }
+    fields.push(field);
+    return fields;
+};
+
 const DEFAULT_PROBLEMS: Problem[] = [
     { id: '1', title: 'Two Sum', difficulty: 'Easy', url: 'https://leetcode.com/problems/two-sum', isSolved: false, category: 'Array & Hashing', technique: 'Hash Map' },
     { id: '2', title: 'LRU Cache', difficulty: 'Medium', url: 'https://leetcode.com/problems/lru-cache', isSolved: false, category: 'Linked List', technique: 'Hash Map & DLL' },
@@ -99,15 +128,16 @@ export const useCodeStore = create<CodeState>()(
 
             importFromCsv: (csvContent) => {
                 const lines = csvContent.split('\n');
-                const headers = lines[0].split(',');
+                const headers = splitCsvLine(lines[0].trim());
+                // Stable ID written by organize_leetcode.py; older CSVs don't have the column
+                const idColumn = headers.indexOf('ID');
                 const problems: Problem[] = [];
 
                 for (let i = 1; i < lines.length; i++) {
                     const line = lines[i].trim();
                     if (!line) continue;
 
-                    // Basic CSV parsing (not handling quoted commas for simplicity as per leetcode_problems.csv)
-                    const parts = line.split(',');
+                    const parts = splitCsvLine(line);
                     if (parts.length < 4) continue;
 
                     const category = parts[0];
@@ -116,9 +146,10 @@ export const useCodeStore = create<CodeState>()(
                     const name = parts[3];
                     const technique = parts[4];
                     const isSolved = parts[5]?.toLowerCase() === 'true' || parts[5]?.toLowerCase() === 'yes';
+                    const stableId = idColumn >= 0 ? parts[idColumn]?.trim() : undefined;
 
                     problems.push({
-                        id: `csv-${problemNo}-${crypto.randomUUID().slice(0, 8)}`,
+                        id: stableId ? `csv-${stableId}` : `csv-${problemNo}-${crypto.randomUUID().slice(0, 8)}`,
                         title: name,
                         url: link,
                         difficulty: 'Medium', // Defaulting as it's not in CSV